@@ -6,13 +6,14 @@ import { API_ENDPOINTS } from '../config/api';
  * 
  * @param {string} sessionId - The session ID from upload response
  * @param {boolean} enabled - Whether to enable SSE connection (default: true)
- * @returns {Object} - { logs, isConnected, error, connectionState }
+ * @returns {Object} - { logs, isConnected, error, connectionState, droppedEvents }
  */
 export function useSSEStream(sessionId, enabled = true) {
   const [logs, setLogs] = useState([]);
   const [isConnected, setIsConnected] = useState(false);
   const [error, setError] = useState(null);
   const [connectionState, setConnectionState] = useState('disconnected');
+  const [droppedEvents, setDroppedEvents] = useState(0);
   
   const eventSourceRef = useRef(null);
   const reconnectTimeoutRef = useRef(null);
@@ -83,6 +84,17 @@ export function useSSEStream(sessionId, enabled = true) {
       console.log('💓 Keepalive ping received');
     });
 
+    // Server-side diagnostics: how many live events were dropped because this client fell behind
+    eventSource.addEventListener('diagnostic', (event) => {
+      try {
+        const { dropped } = JSON.parse(event.data);
+        console.warn(`⚠️ ${dropped} log events dropped by the server for this client`);
+        setDroppedEvents(dropped);
+      } catch (err) {
+        console.error('❌ Failed to parse diagnostic event:', err, event.data);
+      }
+    });
+
   }, [sessionId, enabled]);
 
   // Connect when component mounts
@@ -107,5 +119,6 @@ export function useSSEStream(sessionId, enabled = true) {
     isConnected,
     error,
     connectionState,
+    droppedEvents,
   };
 }
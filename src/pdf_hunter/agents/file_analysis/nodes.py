@@ -16,24 +16,53 @@ from typing import List, Literal, Optional, Dict
 from .prompts import file_analysis_graph_merger_system_prompt, file_analysis_graph_merger_user_prompt
 from .prompts import file_analysis_reviewer_system_prompt, file_analysis_reviewer_user_prompt
 from .prompts import file_analysis_finalizer_system_prompt, file_analysis_finalizer_user_prompt
-from pdf_hunter.config import file_analysis_triage_llm, file_analysis_investigator_llm, file_analysis_graph_merger_llm, file_analysis_reviewer_llm, file_analysis_finalizer_llm
+from pdf_hunter.config import get_llm
 from pdf_hunter.config import THINKING_TOOL_ENABLED
 from pdf_hunter.config.execution_config import LLM_TIMEOUT_TEXT
 from .schemas import TriageReport,MissionReport, ReviewerReport,FinalReport
 from pdf_hunter.shared.utils.serializer import dump_state_to_file
 from datetime import datetime
+from functools import lru_cache
 
 if THINKING_TOOL_ENABLED:
     from pdf_hunter.shared.tools.think_tool import think_tool
     pdf_parser_tools_manifest[think_tool.name] = think_tool.description
     pdf_parser_tools.append(think_tool)
 
-llm_router = file_analysis_triage_llm.with_structured_output(TriageReport)
-llm_investigator = file_analysis_investigator_llm.with_structured_output(MissionReport)
-llm_investigator_with_tools = file_analysis_investigator_llm.bind_tools(pdf_parser_tools)
-llm_graph_merger = file_analysis_graph_merger_llm.with_structured_output(MergedEvidenceGraph)
-llm_reviewer = file_analysis_reviewer_llm.with_structured_output(ReviewerReport)
-llm_finalizer = file_analysis_finalizer_llm.with_structured_output(FinalReport)
+@lru_cache(maxsize=None)
+def _get_router_llm():
+    """Structured-output binding for triage, built once on first use."""
+    return get_llm("file_analysis_triage_llm").with_structured_output(TriageReport)
+
+
+@lru_cache(maxsize=None)
+def _get_investigator_llm():
+    """Structured-output binding for the investigator's final report, built once on first use."""
+    return get_llm("file_analysis_investigator_llm").with_structured_output(MissionReport)
+
+
+@lru_cache(maxsize=None)
+def _get_investigator_llm_with_tools():
+    """Tool-calling binding for the investigator, built once on first use."""
+    return get_llm("file_analysis_investigator_llm").bind_tools(pdf_parser_tools)
+
+
+@lru_cache(maxsize=None)
+def _get_graph_merger_llm():
+    """Structured-output binding for the graph merger, built once on first use."""
+    return get_llm("file_analysis_graph_merger_llm").with_structured_output(MergedEvidenceGraph)
+
+
+@lru_cache(maxsize=None)
+def _get_reviewer_llm():
+    """Structured-output binding for the reviewer, built once on first use."""
+    return get_llm("file_analysis_reviewer_llm").with_structured_output(ReviewerReport)
+
+
+@lru_cache(maxsize=None)
+def _get_finalizer_llm():
+    """Structured-output binding for the finalizer, built once on first use."""
+    return get_llm("file_analysis_finalizer_llm").with_structured_output(FinalReport)
 
 
 async def identify_suspicious_elements(state: FileAnalysisState):
@@ -117,7 +146,7 @@ async def identify_suspicious_elements(state: FileAnalysisState):
         logger.debug("Invoking triage LLM", agent="FileAnalysis", node="identify_suspicious_elements")
         # Add timeout protection to prevent infinite hangs on triage LLM calls
         result = await asyncio.wait_for(
-            llm_router.ainvoke(messages),
+            _get_router_llm().ainvoke(messages),
             timeout=LLM_TIMEOUT_TEXT
         )
 
@@ -434,7 +463,7 @@ async def file_analyzer(state: InvestigatorState):
             )
 
         # --- LLM with Tools Call ---
-        llm_with_tools = llm_investigator_with_tools
+        llm_with_tools = _get_investigator_llm_with_tools()
         
         # DEBUG: Log message sizes before LLM call
         total_chars = sum(len(str(m.content)) for m in messages if hasattr(m, 'content'))
@@ -476,7 +505,7 @@ async def file_analyzer(state: InvestigatorState):
 
             # Add timeout protection to prevent infinite hangs on mission report LLM calls
             mission_report_obj = await asyncio.wait_for(
-                llm_investigator.ainvoke(report_generation_prompt),
+                _get_investigator_llm().ainvoke(report_generation_prompt),
                 timeout=LLM_TIMEOUT_TEXT
             )
             validated_report = MissionReport.model_validate(mission_report_obj)
@@ -596,7 +625,7 @@ async def merge_evidence_graphs(current_master: EvidenceGraph, new_subgraphs: Li
 
         # Add timeout protection to prevent infinite hangs on graph merger LLM calls
         result = await asyncio.wait_for(
-            llm_graph_merger.ainvoke([
+            _get_graph_merger_llm().ainvoke([
                 SystemMessage(content=file_analysis_graph_merger_system_prompt),
                 HumanMessage(content=user_prompt)
             ]),
@@ -820,7 +849,7 @@ async def review_analysis_results(state: FileAnalysisState) -> Command[Literal["
         
         # Add timeout protection to prevent infinite hangs on reviewer LLM calls
         result = await asyncio.wait_for(
-            llm_reviewer.ainvoke([
+            _get_reviewer_llm().ainvoke([
                 SystemMessage(content=file_analysis_reviewer_system_prompt),
                 HumanMessage(content=user_prompt)
             ]),
@@ -981,7 +1010,7 @@ async def summarize_file_analysis(state: FileAnalysisState):
 
         # Add timeout protection to prevent infinite hangs on finalizer LLM calls
         static_analysis_final_report = await asyncio.wait_for(
-            llm_finalizer.ainvoke([
+            _get_finalizer_llm().ainvoke([
                 SystemMessage(content=file_analysis_finalizer_system_prompt),
                 HumanMessage(content=user_prompt)
             ]),
@@ -998,13 +1027,8 @@ async def summarize_file_analysis(state: FileAnalysisState):
         json_path = os.path.join(finalizer_directory, json_filename)
 
         # Add static_analysis_final_report to state before saving
-        from pdf_hunter.shared.utils.serializer import serialize_state_safely
-        state_with_report = {**state, "static_analysis_final_report": static_analysis_final_report.model_dump()}
-        serializable_state = serialize_state_safely(state_with_report)
-
-        # Write to JSON file
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(serializable_state, f, indent=2, ensure_ascii=False)
+        state_with_report = {**state, "static_analysis_final_report": static_analysis_final_report}
+        await dump_state_to_file(state_with_report, json_path)
         
         verdict = static_analysis_final_report.final_verdict
         ioc_count = len(static_analysis_final_report.indicators_of_compromise)
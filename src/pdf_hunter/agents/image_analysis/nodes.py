@@ -1,20 +1,37 @@
 # src/pdf_hunter/agents/visual_analysis/nodes.py
 
+import io
 import json
 import os
+import base64
+import time
+import uuid
 import asyncio
+import hashlib
+import operator
+import orjson
+from functools import lru_cache
 from typing import List
 
 from langchain_core.messages import SystemMessage, HumanMessage
 from loguru import logger
+from PIL import Image
 
 from .schemas import ImageAnalysisState, PageAnalysisResult, ImageAnalysisReport
 from pdf_hunter.shared.utils.serializer import dump_state_to_file
 from .prompts import IMAGE_ANALYSIS_SYSTEM_PROMPT, IMAGE_ANALYSIS_USER_PROMPT
-from pdf_hunter.config import image_analysis_llm
-from pdf_hunter.config.execution_config import LLM_TIMEOUT_VISION
+from pdf_hunter.config import get_llm, model_for_role
+from pdf_hunter.config.execution_config import LLM_TIMEOUT_VISION, IMAGE_ANALYSIS_PARALLEL_PAGES, IMAGE_ANALYSIS_PAGE_CACHE_DIR, IMAGE_ANALYSIS_PAGE_CACHE_TTL, IMAGE_ANALYSIS_MAX_IMAGE_EDGE
 
-llm_with_structured_output = image_analysis_llm.with_structured_output(PageAnalysisResult)
+
+@lru_cache(maxsize=None)
+def _get_vision_llm():
+    """Structured-output binding for the vision LLM, built once on first use."""
+    return get_llm("image_analysis_llm").with_structured_output(PageAnalysisResult)
+
+
+# The system message is identical for every page - build it once
+_SYSTEM_MSG = SystemMessage(content=IMAGE_ANALYSIS_SYSTEM_PROMPT)
 
 
 def _create_structured_forensic_briefing(page_result: PageAnalysisResult) -> str:
@@ -22,13 +39,8 @@ def _create_structured_forensic_briefing(page_result: PageAnalysisResult) -> str
     Creates a concise, yet detailed, briefing of the previous page's analysis
     to be used as context for the next page.
     """
-    # Find the page number from the first detailed finding, if available.
-    page_num = -1 
-    if page_result.detailed_findings:
-        page_num = page_result.detailed_findings[0].page_number
-
     briefing = [
-        f"Context from the previous page (Page {page_num}):",
+        f"Context from the previous page (Page {page_result.page_number}):",
         f"- Page Appearance: {page_result.page_description}",
         f"- Overall Verdict: {page_result.visual_verdict} (Confidence: {page_result.confidence_score:.2f})",
         f"- Summary: {page_result.summary}"
@@ -58,6 +70,263 @@ def _create_structured_forensic_briefing(page_result: PageAnalysisResult) -> str
     return "\n".join(briefing)
 
 
+# Rank of each page verdict, used to pick the overall verdict
+_VERDICT_SEVERITY = {"Benign": 0, "Suspicious": 1, "Highly Deceptive": 2}
+
+# Context given to every page when pages are analyzed independently (IMAGE_ANALYSIS_PARALLEL_PAGES)
+_INDEPENDENT_PAGE_CONTEXT = "Pages are being analyzed independently. No context from other pages is available."
+
+
+def _page_image_url(image) -> str:
+    """Data URL for a page image, downscaled to IMAGE_ANALYSIS_MAX_IMAGE_EDGE if it is larger."""
+    base64_data = image.base64_data
+    if IMAGE_ANALYSIS_MAX_IMAGE_EDGE is not None:
+        try:
+            with Image.open(io.BytesIO(base64.b64decode(base64_data))) as pil_image:
+                if max(pil_image.size) > IMAGE_ANALYSIS_MAX_IMAGE_EDGE:
+                    pil_image.thumbnail((IMAGE_ANALYSIS_MAX_IMAGE_EDGE, IMAGE_ANALYSIS_MAX_IMAGE_EDGE))
+                    buffer = io.BytesIO()
+                    pil_image.save(buffer, format="PNG")
+                    base64_data = base64.b64encode(buffer.getvalue()).decode("ascii")
+        except (OSError, ValueError):
+            # Not an image PIL can read - send the page as extracted
+            pass
+    return f"data:image/png;base64,{base64_data}"
+
+
+def _build_page_messages(image, all_urls, previous_pages_context: str, session_id=None) -> list:
+    """Build the VDA messages for one page: element map, previous-page briefing and the page image."""
+    page_num = image.page_number
+    urls_for_this_page = [url for url in all_urls if url.page_number == page_num]
+
+    # Build element map with page-specific URLs
+    element_map = {
+        "page_number": page_num,
+        "interactive_elements": [url.model_dump() for url in urls_for_this_page]
+    }
+
+    # Add metadata URLs on page 0 (document-level XMP metadata)
+    if page_num == 0:
+        metadata_urls = [url for url in all_urls if url.page_number is None and url.url_type == "metadata"]
+        if metadata_urls:
+            element_map["metadata_urls"] = [url.model_dump() for url in metadata_urls]
+
+    # Format the user prompt with the context and element map.
+    formatted_user_prompt = IMAGE_ANALYSIS_USER_PROMPT.format(
+        # Compact JSON - indentation only adds input tokens for the model
+        element_map_json=orjson.dumps(element_map).decode(),
+        previous_pages_context=previous_pages_context
+    )
+
+    logger.debug(
+        f"Sending page {page_num} to VDA LLM | {len(urls_for_this_page)} interactive elements",
+        agent="ImageAnalysis",
+        node="analyze_images",
+        session_id=session_id,
+        page_number=page_num,
+        element_count=len(urls_for_this_page),
+    )
+
+    return [
+        _SYSTEM_MSG,
+        HumanMessage(
+            content=[
+                {"type": "text", "text": formatted_user_prompt},
+                {
+                    "type": "image_url",
+                    "image_url": {"url": _page_image_url(image)}
+                }
+            ]
+        )
+    ]
+
+
+def _page_cache_key(messages: list, model: str) -> str:
+    """Digest of everything that decides a page verdict: the model, system prompt, user prompt and image."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(model.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(messages[0].content.encode("utf-8"))
+    for part in messages[1].content:
+        digest.update(b"\0")
+        digest.update((part["text"] if part["type"] == "text" else part["image_url"]["url"]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _page_cache_dir(output_directory: str):
+    """
+    Resolve IMAGE_ANALYSIS_PAGE_CACHE_DIR, or return None when the page cache is disabled.
+
+    The state's output_directory is the session directory, so a relative cache
+    directory is placed in its parent (the output root) and shared across sessions.
+    """
+    if IMAGE_ANALYSIS_PAGE_CACHE_DIR is None:
+        return None
+    output_root = os.path.dirname(os.path.normpath(output_directory))
+    return os.path.join(output_root, IMAGE_ANALYSIS_PAGE_CACHE_DIR)
+
+
+async def _invoke_page_llm(messages: list, cache_dir=None) -> PageAnalysisResult:
+    """
+    Get the page verdict from the on-disk page cache, or from the vision LLM on a miss.
+
+    Template-based phishing PDFs reuse identical pages; an exact match on the
+    model, image and prompt (including the previous-page briefing) returns the
+    stored PageAnalysisResult. Caching is best-effort and disabled when
+    cache_dir is None.
+    """
+    if cache_dir is None:
+        # Add timeout protection to prevent infinite hangs on vision LLM calls
+        return await asyncio.wait_for(_get_vision_llm().ainvoke(messages), timeout=LLM_TIMEOUT_VISION)
+
+    key = _page_cache_key(messages, model_for_role("image_analysis"))
+    path = os.path.join(cache_dir, f"{key}.json")
+
+    def _read():
+        try:
+            if time.time() - os.path.getmtime(path) >= IMAGE_ANALYSIS_PAGE_CACHE_TTL:
+                return None
+            with open(path, "rb") as f:
+                return PageAnalysisResult.model_validate_json(f.read())
+        except (OSError, ValueError):
+            return None
+
+    cached = await asyncio.to_thread(_read)
+    if cached is not None:
+        logger.debug("Page verdict served from cache", agent="ImageAnalysis", node="analyze_images", event_type="PAGE_CACHE_HIT")
+        return cached
+
+    # Add timeout protection to prevent infinite hangs on vision LLM calls
+    page_result = await asyncio.wait_for(_get_vision_llm().ainvoke(messages), timeout=LLM_TIMEOUT_VISION)
+
+    def _write():
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a unique temp file and swap in atomically so concurrent readers never see partial entries
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(page_result.model_dump_json())
+            os.replace(tmp_path, path)
+        except OSError:
+            # Don't leave a partial temp file behind in the cache directory
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    try:
+        await asyncio.to_thread(_write)
+    except OSError:
+        pass
+    return page_result
+
+
+def _log_page_start(page_num: int, session_id):
+    """Emit the start event for a page analysis."""
+    logger.info(
+        f"🔍 Analyzing Page {page_num} for visual deception",
+        agent="ImageAnalysis",
+        node="analyze_images",
+        event_type="PAGE_ANALYSIS_START",
+        session_id=session_id,
+        page_number=page_num,
+    )
+
+
+def _log_page_result(page_num: int, page_result: PageAnalysisResult, session_id):
+    """Emit the verdict, findings, tactics, signals and prioritized-URL events for an analyzed page."""
+    # Verdict event with key metrics
+    logger.info(
+        f"📊 Page {page_num} Analysis Complete | Verdict: {page_result.visual_verdict} | Confidence: {page_result.confidence_score:.1%} | Findings: {len(page_result.detailed_findings)} | Summary: {page_result.summary[:80]}...",
+        agent="ImageAnalysis",
+        node="analyze_images",
+        event_type="PAGE_ANALYSIS_COMPLETE",
+        session_id=session_id,
+        page_number=page_num,
+        page_description=page_result.page_description,
+        verdict=page_result.visual_verdict,
+        confidence=page_result.confidence_score,
+        summary=page_result.summary,
+        findings_count=len(page_result.detailed_findings),
+        tactics_count=len(page_result.deception_tactics),
+        benign_signals_count=len(page_result.benign_signals),
+        urls_prioritized=len(page_result.prioritized_urls),
+        detailed_findings=[f.model_dump() for f in page_result.detailed_findings],
+        deception_tactics=[t.model_dump() for t in page_result.deception_tactics],
+        benign_signals=[s.model_dump() for s in page_result.benign_signals],
+    )
+
+    # Log high-significance findings at WARNING level
+    high_sig_findings = [f for f in page_result.detailed_findings if f.significance == "high"]
+    if high_sig_findings:
+        for finding in high_sig_findings:
+            logger.warning(
+                f"⚠️  Page {page_num} High-Significance Finding: {finding.element_type} - {finding.assessment[:80]}",
+                agent="ImageAnalysis",
+                node="analyze_images",
+                event_type="HIGH_SIGNIFICANCE_FINDING",
+                session_id=session_id,
+                page_number=page_num,
+                element_type=finding.element_type,
+                visual_description=finding.visual_description,
+                technical_data=finding.technical_data,
+                assessment=finding.assessment,
+                significance=finding.significance,
+            )
+
+    # Log deception tactics detected
+    if page_result.deception_tactics:
+        tactics_summary = ", ".join([f"{t.tactic_type} ({t.confidence:.0%})" for t in page_result.deception_tactics[:3]])
+        if len(page_result.deception_tactics) > 3:
+            tactics_summary += f" ... and {len(page_result.deception_tactics) - 3} more"
+
+        logger.warning(
+            f"🚨 Page {page_num} Deception Tactics: {tactics_summary}",
+            agent="ImageAnalysis",
+            node="analyze_images",
+            event_type="DECEPTION_TACTICS_DETECTED",
+            session_id=session_id,
+            page_number=page_num,
+            tactics_count=len(page_result.deception_tactics),
+            deception_tactics=[t.model_dump() for t in page_result.deception_tactics],
+        )
+
+    # Log benign signals found
+    if page_result.benign_signals:
+        signals_summary = ", ".join([f"{s.signal_type} ({s.confidence:.0%})" for s in page_result.benign_signals[:3]])
+        if len(page_result.benign_signals) > 3:
+            signals_summary += f" ... and {len(page_result.benign_signals) - 3} more"
+
+        logger.info(
+            f"✅ Page {page_num} Benign Signals: {signals_summary}",
+            agent="ImageAnalysis",
+            node="analyze_images",
+            event_type="BENIGN_SIGNALS_DETECTED",
+            session_id=session_id,
+            page_number=page_num,
+            signals_count=len(page_result.benign_signals),
+            benign_signals=[s.model_dump() for s in page_result.benign_signals],
+        )
+
+    # Log prioritized URLs for investigation
+    if page_result.prioritized_urls:
+        url_summary = ", ".join([f"P{u.priority}: {u.url[:40]}..." for u in page_result.prioritized_urls[:3]])
+        if len(page_result.prioritized_urls) > 3:
+            url_summary += f" ... and {len(page_result.prioritized_urls) - 3} more"
+
+        logger.info(
+            f"🔗 Page {page_num} flagged {len(page_result.prioritized_urls)} URLs for investigation | {url_summary}",
+            agent="ImageAnalysis",
+            node="analyze_images",
+            event_type="URLS_PRIORITIZED",
+            session_id=session_id,
+            page_number=page_num,
+            url_count=len(page_result.prioritized_urls),
+            prioritized_urls=[u.model_dump() for u in page_result.prioritized_urls],
+        )
+
+
 async def analyze_pdf_images(state: ImageAnalysisState):
     """
     Visual Deception Analyst (VDA) analyzes pages with a focus on visually
@@ -69,6 +338,7 @@ async def analyze_pdf_images(state: ImageAnalysisState):
         all_urls = state.get('extracted_urls', [])
         num_pages_to_process = state.get("number_of_pages_to_process", 1)
         session_id = state.get('session_id')
+        page_cache_dir = _page_cache_dir(state.get("output_directory", "output"))
         
         # Agent start event
         logger.info(
@@ -98,10 +368,9 @@ async def analyze_pdf_images(state: ImageAnalysisState):
             total_urls=len(all_urls),
         )
 
-        images_to_process = sorted(
-            [img for img in all_images if img.page_number < num_pages_to_process],
-            key=lambda img: img.page_number
-        )
+        # PDF extraction renders pages in ascending order (range(number_of_pages_to_process)),
+        # so a filter keeps them ordered without re-sorting.
+        images_to_process = [img for img in all_images if img.page_number < num_pages_to_process]
         
         if not images_to_process:
             logger.warning(
@@ -113,163 +382,47 @@ async def analyze_pdf_images(state: ImageAnalysisState):
             return {"page_analyses": []}
 
         page_analyses_results: List[PageAnalysisResult] = []
-        previous_pages_context = "This is the first page. There is no prior context."
-
-        for image in images_to_process:
-            page_num = image.page_number
-            logger.info(
-                f"🔍 Analyzing Page {page_num} for visual deception",
-                agent="ImageAnalysis",
-                node="analyze_images",
-                event_type="PAGE_ANALYSIS_START",
-                session_id=session_id,
-                page_number=page_num,
-            )
 
-            urls_for_this_page = [url for url in all_urls if url.page_number == page_num]
-
-            # Build element map with page-specific URLs
-            element_map = {
-                "page_number": page_num,
-                "interactive_elements": [url.model_dump() for url in urls_for_this_page]
-            }
-
-            # Add metadata URLs on page 0 (document-level XMP metadata)
-            if page_num == 0:
-                metadata_urls = [url for url in all_urls if url.page_number is None and url.url_type == "metadata"]
-                if metadata_urls:
-                    element_map["metadata_urls"] = [url.model_dump() for url in metadata_urls]
-
-            # Format the user prompt with the context and element map.
-            formatted_user_prompt = IMAGE_ANALYSIS_USER_PROMPT.format(
-                element_map_json=json.dumps(element_map, indent=2),
-                previous_pages_context=previous_pages_context
-            )
-            
-            # Construct the full, correct list of messages for the LLM call.
-            messages = [
-                SystemMessage(content=IMAGE_ANALYSIS_SYSTEM_PROMPT),
-                HumanMessage(
-                    content=[
-                        {"type": "text", "text": formatted_user_prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {"url": f"data:image/png;base64,{image.base64_data}"}
-                        }
-                    ]
-                )
-            ]
+        if IMAGE_ANALYSIS_PARALLEL_PAGES:
+            # Independent mode: every page is sent at once, without briefings from earlier pages
+            for image in images_to_process:
+                _log_page_start(image.page_number, session_id)
+
+            async def _analyze_page(image):
+                messages = await asyncio.to_thread(_build_page_messages, image, all_urls, _INDEPENDENT_PAGE_CONTEXT, session_id)
+                page_result = await _invoke_page_llm(messages, page_cache_dir)
+                page_result.page_number = image.page_number
+                return page_result
+
+            # A TaskGroup cancels the remaining vision calls as soon as one page fails
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    page_tasks = [task_group.create_task(_analyze_page(image)) for image in images_to_process]
+            except ExceptionGroup as eg:
+                # Fail the node with the page's own error, as sequential mode does
+                raise eg.exceptions[0]
+            page_analyses_results = [task.result() for task in page_tasks]
+            for image, page_result in zip(images_to_process, page_analyses_results):
+                _log_page_result(image.page_number, page_result, session_id)
+        else:
+            previous_pages_context = "This is the first page. There is no prior context."
+
+            for image in images_to_process:
+                page_num = image.page_number
+                _log_page_start(page_num, session_id)
+
+                # Construct the full, correct list of messages for the LLM call.
+                # (in a worker thread - downscaling a large page image is CPU work)
+                messages = await asyncio.to_thread(_build_page_messages, image, all_urls, previous_pages_context, session_id)
+
+                page_result = await _invoke_page_llm(messages, page_cache_dir)
+                page_result.page_number = page_num
+                page_analyses_results.append(page_result)
+                _log_page_result(page_num, page_result, session_id)
+
+                # Generate the rich, structured briefing for the next iteration.
+                previous_pages_context = _create_structured_forensic_briefing(page_result)
 
-            # Invoke the LLM with the correct message structure.
-            logger.debug(
-                f"Sending page {page_num} to VDA LLM | {len(urls_for_this_page)} interactive elements",
-                agent="ImageAnalysis",
-                node="analyze_images",
-                session_id=session_id,
-                page_number=page_num,
-                element_count=len(urls_for_this_page),
-            )
-            
-            # Add timeout protection to prevent infinite hangs on vision LLM calls
-            page_result = await asyncio.wait_for(
-                llm_with_structured_output.ainvoke(messages),
-                timeout=LLM_TIMEOUT_VISION
-            )
-            page_analyses_results.append(page_result)
-            
-            # Verdict event with key metrics
-            logger.info(
-                f"📊 Page {page_num} Analysis Complete | Verdict: {page_result.visual_verdict} | Confidence: {page_result.confidence_score:.1%} | Findings: {len(page_result.detailed_findings)} | Summary: {page_result.summary[:80]}...",
-                agent="ImageAnalysis",
-                node="analyze_images",
-                event_type="PAGE_ANALYSIS_COMPLETE",
-                session_id=session_id,
-                page_number=page_num,
-                page_description=page_result.page_description,
-                verdict=page_result.visual_verdict,
-                confidence=page_result.confidence_score,
-                summary=page_result.summary,
-                findings_count=len(page_result.detailed_findings),
-                tactics_count=len(page_result.deception_tactics),
-                benign_signals_count=len(page_result.benign_signals),
-                urls_prioritized=len(page_result.prioritized_urls),
-                detailed_findings=[f.model_dump() for f in page_result.detailed_findings],
-                deception_tactics=[t.model_dump() for t in page_result.deception_tactics],
-                benign_signals=[s.model_dump() for s in page_result.benign_signals],
-            )
-            
-            # Log high-significance findings at WARNING level
-            high_sig_findings = [f for f in page_result.detailed_findings if f.significance == "high"]
-            if high_sig_findings:
-                for finding in high_sig_findings:
-                    logger.warning(
-                        f"⚠️  Page {page_num} High-Significance Finding: {finding.element_type} - {finding.assessment[:80]}",
-                        agent="ImageAnalysis",
-                        node="analyze_images",
-                        event_type="HIGH_SIGNIFICANCE_FINDING",
-                        session_id=session_id,
-                        page_number=page_num,
-                        element_type=finding.element_type,
-                        visual_description=finding.visual_description,
-                        technical_data=finding.technical_data,
-                        assessment=finding.assessment,
-                        significance=finding.significance,
-                    )
-            
-            # Log deception tactics detected
-            if page_result.deception_tactics:
-                tactics_summary = ", ".join([f"{t.tactic_type} ({t.confidence:.0%})" for t in page_result.deception_tactics[:3]])
-                if len(page_result.deception_tactics) > 3:
-                    tactics_summary += f" ... and {len(page_result.deception_tactics) - 3} more"
-                
-                logger.warning(
-                    f"🚨 Page {page_num} Deception Tactics: {tactics_summary}",
-                    agent="ImageAnalysis",
-                    node="analyze_images",
-                    event_type="DECEPTION_TACTICS_DETECTED",
-                    session_id=session_id,
-                    page_number=page_num,
-                    tactics_count=len(page_result.deception_tactics),
-                    deception_tactics=[t.model_dump() for t in page_result.deception_tactics],
-                )
-            
-            # Log benign signals found
-            if page_result.benign_signals:
-                signals_summary = ", ".join([f"{s.signal_type} ({s.confidence:.0%})" for s in page_result.benign_signals[:3]])
-                if len(page_result.benign_signals) > 3:
-                    signals_summary += f" ... and {len(page_result.benign_signals) - 3} more"
-                
-                logger.info(
-                    f"✅ Page {page_num} Benign Signals: {signals_summary}",
-                    agent="ImageAnalysis",
-                    node="analyze_images",
-                    event_type="BENIGN_SIGNALS_DETECTED",
-                    session_id=session_id,
-                    page_number=page_num,
-                    signals_count=len(page_result.benign_signals),
-                    benign_signals=[s.model_dump() for s in page_result.benign_signals],
-                )
-            
-            # Log prioritized URLs for investigation
-            if page_result.prioritized_urls:
-                url_summary = ", ".join([f"P{u.priority}: {u.url[:40]}..." for u in page_result.prioritized_urls[:3]])
-                if len(page_result.prioritized_urls) > 3:
-                    url_summary += f" ... and {len(page_result.prioritized_urls) - 3} more"
-                
-                logger.info(
-                    f"🔗 Page {page_num} flagged {len(page_result.prioritized_urls)} URLs for investigation | {url_summary}",
-                    agent="ImageAnalysis",
-                    node="analyze_images",
-                    event_type="URLS_PRIORITIZED",
-                    session_id=session_id,
-                    page_number=page_num,
-                    url_count=len(page_result.prioritized_urls),
-                    prioritized_urls=[u.model_dump() for u in page_result.prioritized_urls],
-                )
-
-            # Generate the rich, structured briefing for the next iteration.
-            previous_pages_context = _create_structured_forensic_briefing(page_result)
-        
         logger.success(
             f"✅ Visual analysis complete | {len(page_analyses_results)} pages analyzed",
             agent="ImageAnalysis",
@@ -346,28 +499,30 @@ async def compile_image_findings(state: ImageAnalysisState):
             return {"visual_analysis_report": visual_analysis_report}
 
         # Ensure pages are sorted for a logical flow summary.
-        sorted_analyses = sorted(page_analyses, key=lambda p: p.detailed_findings[0].page_number if p.detailed_findings else 0)
+        sorted_analyses = sorted(page_analyses, key=operator.attrgetter("page_number"))
 
         # --- Generate the Document Flow Summary ---
-        flow_steps = []
-        for analysis in sorted_analyses:
-            page_num = analysis.detailed_findings[0].page_number if analysis.detailed_findings else 'N/A'
-            flow_steps.append(f"Page {page_num}: {analysis.page_description}")
-        document_flow_summary = "\n".join(flow_steps)
+        document_flow_summary = "\n".join(
+            f"Page {analysis.page_number}: {analysis.page_description}" for analysis in sorted_analyses
+        )
         
-        # Determine Overall Verdict based on the most severe finding.
-        verdict_severity = {"Benign": 0, "Suspicious": 1, "Highly Deceptive": 2}
-        most_severe_verdict = max(page_analyses, key=lambda p: verdict_severity[p.visual_verdict]).visual_verdict
-
-        # Correctly calculate Overall Confidence based on the "weakest link" principle.
-        pages_with_highest_threat = [p for p in page_analyses if p.visual_verdict == most_severe_verdict]
-        overall_confidence = max(p.confidence_score for p in pages_with_highest_threat)
-
-        # Aggregate all findings into flat lists for the final report.
-        all_detailed_findings = [finding for p in page_analyses for finding in p.detailed_findings]
-        all_tactics = [tactic for p in page_analyses for tactic in p.deception_tactics]
-        all_signals = [signal for p in page_analyses for signal in p.benign_signals]
-        all_priority_urls = [url for p in page_analyses for url in p.prioritized_urls]
+        # One pass over the pages: the most severe verdict, the highest confidence
+        # among pages with that verdict ("weakest link" principle), and the flat
+        # finding lists for the final report.
+        best_severity, overall_confidence = -1, 0.0
+        most_severe_verdict = "Benign"
+        all_detailed_findings, all_tactics, all_signals, all_priority_urls = [], [], [], []
+        for p in page_analyses:
+            severity = _VERDICT_SEVERITY[p.visual_verdict]
+            if severity > best_severity:
+                best_severity, overall_confidence = severity, p.confidence_score
+                most_severe_verdict = p.visual_verdict
+            elif severity == best_severity and p.confidence_score > overall_confidence:
+                overall_confidence = p.confidence_score
+            all_detailed_findings.extend(p.detailed_findings)
+            all_tactics.extend(p.deception_tactics)
+            all_signals.extend(p.benign_signals)
+            all_priority_urls.extend(p.prioritized_urls)
 
         # Generate the Executive Summary (before logging so we can include it).
         summary = (
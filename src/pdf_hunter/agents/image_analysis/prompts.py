@@ -55,18 +55,11 @@ Your final verdict must be a synthesis of how you weighed the evidence from both
 Only populate the `deception_tactics` array with tactics that actively enable deception or compromise on THIS page. Psychological manipulation or authority mimicry should ONLY be reported if they are coupled with an interactive element that can execute a deceptive action. Do not report tactics that would be deceptive "if interactive elements were present" - if no action is possible, no deception tactic exists.
 """
 
+# Invariant instructions come first and the per-page context last, so every page call shares
+# the longest possible identical prefix (system prompt + instructions) for provider prompt caching
 IMAGE_ANALYSIS_USER_PROMPT = """
 I need you to analyze the following PDF page for visual deception tactics.
 
----
-**Forensic Context from Previous Pages:**
-{previous_pages_context}
----
-**Technical Blueprint (Element Map for CURRENT page):**
-```json
-{element_map_json}
-```
-
 **Note on Metadata URLs (Page 0 only):**
 If the element map contains a `metadata_urls` field, these URLs are from the document's XMP metadata (invisible technical data, not visible on the rendered page). Assess them for:
 - **Domain legitimacy**: Are the creator tool domains legitimate or typosquatted?
@@ -76,10 +69,19 @@ If the element map contains a `metadata_urls` field, these URLs are from the doc
 
 **Your Mission:**
 
-1. **Review the Forensic Context:** Understand the findings from the pages that came before this one.
+1. **Review the Forensic Context:** Understand the findings from the pages that came before this one (provided below).
 2. **Examine the Visual Evidence:** Analyze the attached image of the **current page**.
-3. **Cross-Reference the Technical Blueprint:** Compare what you see in the image with the structured data provided for the current page.
+3. **Cross-Reference the Technical Blueprint:** Compare what you see in the image with the structured data provided below for the current page.
 4. **Synthesize and Decide:** Based on all available information (previous context, current image, and current technical data), perform your full analysis as per your system instructions.
 
 Provide your complete analysis for the **CURRENT PAGE ONLY** in the required `PageAnalysisResult` JSON format.
+
+---
+**Forensic Context from Previous Pages:**
+{previous_pages_context}
+---
+**Technical Blueprint (Element Map for CURRENT page):**
+```json
+{element_map_json}
+```
 """
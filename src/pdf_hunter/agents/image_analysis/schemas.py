@@ -2,6 +2,7 @@ from enum import Enum
 import operator
 from typing import List, Optional, Literal
 from pydantic import BaseModel, Field
+from pydantic.json_schema import SkipJsonSchema
 from typing_extensions import TypedDict, Annotated, NotRequired
 
 from ..pdf_extraction.schemas import ExtractedImage, ExtractedURL
@@ -64,7 +65,9 @@ class PageAnalysisResult(BaseModel):
     visual_verdict: Literal["Benign", "Suspicious", "Highly Deceptive"] = Field(..., description="Final visual trustworthiness judgment for this page")
     confidence_score: float = Field(..., description="Confidence in the verdict for this page (0.0-1.0).")
     summary: str = Field(..., description="Concise summary explaining conclusion and evidence weighting for this page")
-    
+    # Hidden from the LLM's output schema; the agent sets it after the LLM call
+    page_number: SkipJsonSchema[int] = Field(-1, description="The page number (0-indexed) this analysis covers.")
+
 
 
 class ImageAnalysisReport(BaseModel):
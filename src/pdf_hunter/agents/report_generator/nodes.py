@@ -2,16 +2,23 @@ import json
 import os
 import asyncio
 from datetime import datetime
+from functools import lru_cache
 from loguru import logger
 from langchain_core.messages import SystemMessage, HumanMessage
 from langsmith import get_current_run_tree
-from pdf_hunter.config import report_generator_llm, final_verdict_llm
+from pdf_hunter.config import get_llm
 from .schemas import ReportGeneratorState, FinalVerdict
 from pdf_hunter.shared.utils.serializer import serialize_state_safely, dump_state_to_file
 from .prompts import REPORT_GENERATOR_SYSTEM_PROMPT, REPORT_GENERATOR_USER_PROMPT, REPORT_GENERATOR_VERDICT_SYSTEM_PROMPT, REPORT_GENERATOR_VERDICT_USER_PROMPT
 from pdf_hunter.config.execution_config import LLM_TIMEOUT_TEXT
 
 
+@lru_cache(maxsize=None)
+def _get_verdict_llm():
+    """Structured-output binding for the final verdict, built once on first use."""
+    return get_llm("final_verdict_llm").with_structured_output(FinalVerdict)
+
+
 def _strip_base64_from_state(state: ReportGeneratorState) -> dict:
     """
     Strip base64_data from extracted_images to reduce token usage.
@@ -92,12 +99,11 @@ async def determine_threat_verdict(state: ReportGeneratorState) -> dict:
             )),
         ]
 
-        # Use a separate, structured-output LLM for the final verdict
+        # Use the separate, structured-output LLM for the final verdict
         logger.debug("Invoking final verdict LLM", agent="ReportGenerator", node="determine_threat_verdict")
-        llm_with_verdict = final_verdict_llm.with_structured_output(FinalVerdict)
         # Add timeout protection to prevent infinite hangs on verdict LLM calls
         response = await asyncio.wait_for(
-            llm_with_verdict.ainvoke(messages),
+            _get_verdict_llm().ainvoke(messages),
             timeout=LLM_TIMEOUT_TEXT
         )
         
@@ -166,7 +172,7 @@ async def generate_final_report(state: ReportGeneratorState):
         logger.debug("Invoking report generator LLM", agent="ReportGenerator", node="generate_final_report")
         # Add timeout protection to prevent infinite hangs on report generator LLM calls
         response = await asyncio.wait_for(
-            report_generator_llm.ainvoke(messages),
+            get_llm("report_generator_llm").ainvoke(messages),
             timeout=LLM_TIMEOUT_TEXT
         )
         final_report = response.content
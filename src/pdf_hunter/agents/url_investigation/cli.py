@@ -3,11 +3,13 @@
 import asyncio
 import argparse
 import os
+from contextlib import AsyncExitStack
 from loguru import logger
 from pdf_hunter.config.logging_config import setup_logging
 
 from .schemas import PrioritizedURL
 from .graph import link_analysis_graph
+from ...shared.utils.mcp_client import cleanup_mcp_session
 
 
 def parse_args():
@@ -54,6 +56,12 @@ Examples:
     return parser.parse_args()
 
 
+async def _cleanup_sessions():
+    """Shut down every MCP browser session opened during the run."""
+    logger.debug("Cleaning up MCP sessions", agent="TestRunner", node="main")
+    await cleanup_mcp_session()  # This will cleanup all sessions
+
+
 async def main():
     """Main entry point for the URL investigation CLI."""
     args = parse_args()
@@ -113,18 +121,16 @@ async def main():
 
     logger.info("Running the full URL Investigator -> Analyst pipeline", agent="TestRunner", node="main")
     
-    try:
-        logger.debug("Invoking link analysis graph with test state", agent="TestRunner", node="main")
-        final_state = await link_analysis_graph.ainvoke(test_state)
-        logger.info("Link analysis graph execution complete", agent="TestRunner", node="main")
-    except Exception as e:
-        logger.error(f"Error during link analysis: {str(e)}", agent="TestRunner", node="main", exc_info=True)
-        raise
-    finally:
-        # Cleanup all MCP sessions when done
-        from ...shared.utils.mcp_client import cleanup_mcp_session
-        logger.debug("Cleaning up MCP sessions", agent="TestRunner", node="main")
-        await cleanup_mcp_session()  # This will cleanup all sessions
+    async with AsyncExitStack() as stack:
+        # Cleanup all MCP sessions when done - registered first so it also runs on cancellation
+        stack.push_async_callback(_cleanup_sessions)
+        try:
+            logger.debug("Invoking link analysis graph with test state", agent="TestRunner", node="main")
+            final_state = await link_analysis_graph.ainvoke(test_state)
+            logger.info("Link analysis graph execution complete", agent="TestRunner", node="main")
+        except Exception as e:
+            logger.error(f"Error during link analysis: {str(e)}", agent="TestRunner", node="main", exc_info=True)
+            raise
     
     logger.info("Generating final forensic report", agent="TestRunner", node="verify")
     if final_state.get("link_analysis_final_reports"):
@@ -1,17 +1,15 @@
 import asyncio
-import os
-import json
-import uuid
-from datetime import datetime
-from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
 from loguru import logger
 from langgraph.graph import StateGraph, START, END
 from langgraph.errors import GraphRecursionError
 
 from .schemas import URLInvestigationState, URLInvestigationInputState, URLInvestigationOutputState, URLInvestigatorState, URLInvestigatorOutputState, URLAnalysisResult, AnalystFindings
-from ..image_analysis.schemas import PrioritizedURL
-from .nodes import investigate_url, execute_browser_tools, analyze_url_content, should_continue, route_url_analysis, filter_high_priority_urls, save_url_analysis_state
+from ..image_analysis.schemas import URLMissionStatus
+from .nodes import investigate_url, execute_browser_tools, analyze_url_content, should_continue, route_url_analysis, filter_high_priority_urls, save_url_analysis_state, get_url_task_id, evict_task_toolbelt
 from pdf_hunter.config import URL_INVESTIGATION_CONFIG, URL_INVESTIGATION_INVESTIGATOR_CONFIG
+from pdf_hunter.config.execution_config import URL_INVESTIGATION_TIMEOUT, URL_INVESTIGATION_MAX_CONCURRENCY
+from pdf_hunter.shared.utils.mcp_client import mcp_session_scope
 
 
 link_investigator_state = StateGraph(URLInvestigatorState, output_schema=URLInvestigatorOutputState)
@@ -32,10 +30,110 @@ link_investigator_graph = link_investigator_state.compile()
 link_investigator_graph = link_investigator_graph.with_config(URL_INVESTIGATION_INVESTIGATOR_CONFIG)
 
 
+# In-flight investigator runs keyed by (session output directory, canonical URL).
+# Duplicate URLs dispatched in the same run await the same task instead of
+# spawning a second browser investigation. Like the mission semaphore, the map
+# and its lock are created lazily per event loop, since tasks cannot be awaited across loops.
+_inflight: dict[tuple[str, str], asyncio.Task] = {}
+_inflight_lock: asyncio.Lock | None = None
+_inflight_loop = None
+
+
+# Caps how many URL missions (each with its own browser) run at once.
+# Created lazily per event loop, like the MCP session lock.
+_mission_semaphore: asyncio.Semaphore | None = None
+_mission_semaphore_loop = None
+
+
+def _get_mission_semaphore() -> asyncio.Semaphore:
+    """Return the mission semaphore bound to the running event loop."""
+    global _mission_semaphore, _mission_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _mission_semaphore is None or _mission_semaphore_loop is not loop:
+        _mission_semaphore = asyncio.Semaphore(URL_INVESTIGATION_MAX_CONCURRENCY)
+        _mission_semaphore_loop = loop
+    return _mission_semaphore
+
+
+def _get_inflight() -> tuple[asyncio.Lock, dict[tuple[str, str], asyncio.Task]]:
+    """Return the in-flight lock and task map bound to the running event loop."""
+    global _inflight, _inflight_lock, _inflight_loop
+    loop = asyncio.get_running_loop()
+    if _inflight_lock is None or _inflight_loop is not loop:
+        _inflight = {}
+        _inflight_lock = asyncio.Lock()
+        _inflight_loop = loop
+    return _inflight_lock, _inflight
+
+
+def _canon(url: str) -> str:
+    """Normalize a URL for deduplication: lowercase scheme/host, no trailing slash, no fragment."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/") or "/", parts.query, ""))
+
+
+async def _run_investigation(state: dict, key: tuple[str, str]):
+    """
+    Run the investigator subgraph under the per-URL time budget, then release
+    the in-flight slot and shut down the URL's browser session.
+
+    At most URL_INVESTIGATION_MAX_CONCURRENCY missions run at once; the time
+    budget starts once a slot is acquired.
+    """
+    task_id = state.get("task_id") or get_url_task_id(state["url_task"].url)
+    try:
+        async with _get_mission_semaphore():
+            async with mcp_session_scope(task_id, state.get("output_directory")):
+                async with asyncio.timeout(URL_INVESTIGATION_TIMEOUT):
+                    return await link_investigator_graph.ainvoke(state)
+    finally:
+        evict_task_toolbelt(task_id, state.get("output_directory"))
+        _get_inflight()[1].pop(key, None)
+
+
+def _make_failed_result(url_task, kind: str, detail) -> URLAnalysisResult:
+    """
+    Build a minimal URLAnalysisResult marking an investigation that was cut short.
+
+    Args:
+        url_task: The PrioritizedURL being investigated
+        kind: Why the investigation stopped ("recursion_limit" or "timeout")
+        detail: The limit that was hit (step count or seconds)
+    """
+    if kind == "timeout":
+        error_msg = f"URL analysis for {url_task.url} timed out after {detail}s"
+        summary = f"Investigation exceeded the time budget of {detail} seconds. The URL analysis could not be completed because the site or a tool stopped responding. Manual investigation may be required."
+    else:
+        error_msg = f"URL analysis for {url_task.url} hit recursion limit - investigation too complex or stuck in loop"
+        summary = f"Investigation exceeded recursion limit of {detail} steps. The URL analysis could not be completed due to complexity or infinite loop. Manual investigation may be required."
+
+    url_task.mission_status = URLMissionStatus.FAILED
+    return URLAnalysisResult(
+        initial_url=url_task,
+        full_investigation_log=[{
+            "error": error_msg,
+            "status": f"{kind}_exceeded"
+        }],
+        analyst_findings=AnalystFindings(
+            final_url=url_task.url,
+            verdict="Inaccessible",
+            confidence=0.0,
+            summary=summary,
+            detected_threats=[],
+            mission_status="failed"
+        )
+    )
+
+
 async def conduct_link_analysis(state: dict):
     """
     Wrapper for the investigator subgraph that ensures outputs are collected
     into the completed_investigations list.
+
+    Concurrent requests for the same canonical URL within a session share a
+    single investigator run; only the first caller reports the result.
+    Each run is bounded by URL_INVESTIGATION_TIMEOUT so one hung site cannot
+    hold up the rest of the batch.
     """
     url_task = state.get("url_task")
     url = url_task.url if url_task else "unknown URL"
@@ -43,9 +141,34 @@ async def conduct_link_analysis(state: dict):
     logger.info(f"🔍 Starting link analysis for URL: {url}", agent="URLInvestigation", node="conduct_link_analysis_wrapper", event_type="WRAPPER_START", url=url)
     
     try:
-        # Run the investigator subgraph
-        logger.debug("Invoking link investigator graph", agent="URLInvestigation", node="conduct_link_analysis_wrapper")
-        result = await link_investigator_graph.ainvoke(state)
+        key = (state.get("output_directory", ""), _canon(url))
+        inflight_lock, inflight = _get_inflight()
+        async with inflight_lock:
+            task = inflight.get(key)
+            is_duplicate = task is not None
+            if task is None:
+                # Run the investigator subgraph
+                logger.debug("Invoking link investigator graph", agent="URLInvestigation", node="conduct_link_analysis_wrapper")
+                task = asyncio.create_task(_run_investigation(state, key))
+                inflight[key] = task
+
+        if is_duplicate:
+            logger.info(f"♻️ URL already under investigation in this run, reusing result: {url}", agent="URLInvestigation", node="conduct_link_analysis_wrapper", event_type="WRAPPER_DEDUPLICATED", url=url)
+            try:
+                result = await task
+            except Exception:
+                # The owning branch reports the failure
+                if url_task:
+                    url_task.mission_status = URLMissionStatus.FAILED
+                return {}
+
+            # Mirror the shared outcome onto this URL entry without reporting it twice
+            shared_report = result.get("link_analysis_final_report")
+            if url_task and shared_report:
+                url_task.mission_status = shared_report.initial_url.mission_status
+            return {}
+
+        result = await task
         
         # The result should contain the fields from InvestigatorOutputState
         # We need to wrap it in a list so it gets aggregated via operator.add
@@ -55,31 +178,26 @@ async def conduct_link_analysis(state: dict):
             "errors": result.get("errors", [])
         }
     
+    except TimeoutError:
+        # A hung LLM call or browser tool - mark URL analysis as failed instead of blocking the batch
+        failed_result = _make_failed_result(url_task, "timeout", URL_INVESTIGATION_TIMEOUT)
+        error_msg = failed_result.full_investigation_log[0]["error"]
+        logger.warning(error_msg, agent="URLInvestigation", node="conduct_link_analysis_wrapper", event_type="URL_TIMEOUT", url=url)
+        
+        return {
+            "link_analysis_final_reports": [failed_result],
+            "errors": [error_msg]
+        }
+    
     except GraphRecursionError as e:
         # Handle recursion limit specifically - mark URL analysis as failed with context
-        error_msg = f"URL analysis for {url} hit recursion limit - investigation too complex or stuck in loop"
+        failed_result = _make_failed_result(url_task, "recursion_limit", URL_INVESTIGATION_INVESTIGATOR_CONFIG.get('recursion_limit', 20))
+        error_msg = failed_result.full_investigation_log[0]["error"]
         logger.warning(error_msg, agent="URLInvestigation", node="conduct_link_analysis_wrapper", event_type="RECURSION_LIMIT", url=url)
         logger.debug(f"Recursion error details: {e}", agent="URLInvestigation", node="conduct_link_analysis_wrapper")
         
-        # Create a minimal URLAnalysisResult marking the investigation as failed
-        failed_result = URLAnalysisResult(
-            initial_url=url_task,
-            full_investigation_log=[{
-                "error": error_msg,
-                "status": "recursion_limit_exceeded"
-            }],
-            analyst_findings=AnalystFindings(
-                final_url=url_task.url,
-                verdict="Inaccessible",
-                confidence=0.0,
-                summary=f"Investigation exceeded recursion limit of {URL_INVESTIGATION_INVESTIGATOR_CONFIG.get('recursion_limit', 20)} steps. The URL analysis could not be completed due to complexity or infinite loop. Manual investigation may be required.",
-                detected_threats=[],
-                mission_status="failed"
-            )
-        )
-        
         return {
-            "link_analysis_final_reports": [{"link_analysis_final_report": failed_result}],
+            "link_analysis_final_reports": [failed_result],
             "errors": [error_msg]
         }
     
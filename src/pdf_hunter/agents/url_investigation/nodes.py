@@ -1,27 +1,57 @@
 import os
-import json
+import re
+import time
 import asyncio
+import hashlib
+import functools
+import orjson
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from datetime import datetime
 from loguru import logger
 from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage
-from typing import Literal
+from typing import Literal, NamedTuple
+from pdf_hunter.shared.tools import think_tool
 from pdf_hunter.agents.image_analysis.schemas import URLMissionStatus
 from .tools import domain_whois
 from pdf_hunter.shared.utils.serializer import dump_state_to_file
+from pdf_hunter.shared.utils.mcp_cache import cached_invoke
+from pdf_hunter.shared.utils.mcp_client import get_mcp_session
 from langgraph.types import Send
 from langgraph.graph import END
 from pdf_hunter.config import THINKING_TOOL_ENABLED, URL_INVESTIGATION_PRIORITY_LEVEL
-from pdf_hunter.config.execution_config import LLM_TIMEOUT_TEXT
+from pdf_hunter.config.execution_config import LLM_TIMEOUT_TEXT, URL_INVESTIGATION_WHOIS_CACHE_TTL, URL_INVESTIGATION_LLM_CACHE_SIZE, URL_INVESTIGATION_SPILL_THRESHOLD, URL_INVESTIGATION_SPILL_PREVIEW_CHARS, URL_INVESTIGATION_MAX_CONCURRENT_TOOLS, URL_INVESTIGATION_ANALYST_TOOL_CHARS, URL_INVESTIGATION_TOOLBELT_TTL, URL_INVESTIGATION_LOG_PREVIEW_CHARS
 
 
-from pdf_hunter.config import url_investigation_investigator_llm, url_investigation_analyst_llm
+from pdf_hunter.config import get_llm
 from .schemas import URLInvestigationState, URLInvestigatorState, URLAnalysisResult, AnalystFindings
 from .prompts import URL_INVESTIGATION_INVESTIGATOR_SYSTEM_PROMPT, URL_INVESTIGATION_ANALYST_SYSTEM_PROMPT, URL_INVESTIGATION_ANALYST_USER_PROMPT, URL_INVESTIGATION_LOG_SUMMARIZATION_PROMPT
 
+# System messages are constant - build them once and reuse them for every investigation
+_INVESTIGATOR_SYSTEM_MSG = SystemMessage(content=URL_INVESTIGATION_INVESTIGATOR_SYSTEM_PROMPT)
+_ANALYST_SYSTEM_MSG = SystemMessage(content=URL_INVESTIGATION_ANALYST_SYSTEM_PROMPT)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_analyst_llm():
+    """Structured-output binding for the analyst, built once on first use."""
+    return get_llm("url_investigation_analyst_llm").with_structured_output(AnalystFindings)
+
+
+# load_mcp_tools, resolved by the first load_mcp_tools_async call
+_load_mcp_tools_fn = None
+
+
 # Helper function to load MCP tools asynchronously
 async def load_mcp_tools_async(session):
     """
-    Load MCP tools in a non-blocking way by moving the import to a separate thread.
+    Load MCP tools in a non-blocking way.
+
+    The first call imports langchain_mcp_adapters in a separate thread (the
+    import is slow and would block the event loop); later calls await the
+    cached function directly.
     
     Args:
         session: The MCP session to use
@@ -29,14 +59,230 @@ async def load_mcp_tools_async(session):
     Returns:
         The loaded MCP tools
     """
-    def _load_tools():
-        from langchain_mcp_adapters.tools import load_mcp_tools
-        return load_mcp_tools
-    
-    load_mcp_tools_fn = await asyncio.to_thread(_load_tools)
-    return await load_mcp_tools_fn(session)
+    global _load_mcp_tools_fn
+    if _load_mcp_tools_fn is None:
+        def _load_tools():
+            from langchain_mcp_adapters.tools import load_mcp_tools
+            return load_mcp_tools
+
+        _load_mcp_tools_fn = await asyncio.to_thread(_load_tools)
+    return await _load_mcp_tools_fn(session)
+
+
+# Tools that run in-process rather than against the shared browser page
+_LOCAL_TOOL_NAMES = frozenset({"domain_whois", "think_tool"})
+
+
+# Escapes angle brackets in error text so Loguru's colorizer does not read them as markup tags
+_LOG_SAFE_TABLE = str.maketrans({"<": "{{", ">": "}}"})
+
+
+# Observation prefixes execute_browser_tools uses when a tool call itself failed
+_TOOL_ERROR_PREFIXES = ("Tool execution failed:", "Unexpected error in tool")
+
+
+class _ToolCall(NamedTuple):
+    """Uniform view of a tool call, whether the model returned it as a dict or an object."""
+    name: str
+    args: dict
+    id: str
+
+
+def _normalize_tool_call(tool_call) -> _ToolCall:
+    """Read name, args and id from a tool call once, so later code needs no dict/object branching."""
+    if isinstance(tool_call, dict):
+        return _ToolCall(tool_call.get("name", "unknown"), tool_call.get("args", {}), tool_call.get("id"))
+    return _ToolCall(getattr(tool_call, "name", "unknown"), getattr(tool_call, "args", {}), getattr(tool_call, "id", None))
+
+
+def _is_cacheable_whois(observation) -> bool:
+    """Keep WHOIS lookup failures (timeouts, rate limits) out of the response cache."""
+    return not str(observation).startswith(("Error: Could not retrieve", "An unexpected error"))
+
+
+@functools.lru_cache(maxsize=256)
+def _url_investigation_dir(session_output_dir: str) -> str:
+    """The agent's directory within a session output directory."""
+    return os.path.join(session_output_dir, "url_investigation")
+
+
+@functools.lru_cache(maxsize=256)
+def _task_investigation_dir(session_output_dir: str, task_id: str) -> str:
+    """Per-investigation directory; the same task_{task_id} layout MCP Playwright writes screenshots and traces to."""
+    return os.path.join(_url_investigation_dir(session_output_dir), f"task_{task_id}")
+
+
+def get_url_task_id(url: str) -> str:
+    """
+    Task ID used to isolate the MCP session and output directory of a URL investigation.
+
+    Uses a BLAKE2b digest rather than hash() so the same URL maps to the same
+    task directory across processes (hash() is randomized per interpreter).
+    """
+    return "url_" + hashlib.blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@dataclass
+class Toolbelt:
+    """Live MCP session, loaded tools and tool-bound model of one investigation."""
+    session: object
+    mcp_tools: list
+    all_tools: list
+    tool_by_name: Mapping[str, object]
+    model_with_tools: object
+    loaded_at: float = field(default_factory=time.monotonic)
+
+
+# Toolbelts keyed by (task_id, output directory). Built on the first investigate_url turn and
+# reused until the investigation ends or the entry is older than URL_INVESTIGATION_TOOLBELT_TTL.
+_toolbelt_cache: dict[tuple[str, str], Toolbelt] = {}
+
+
+async def _get_task_toolbelt(task_id: str, session_output_dir: str) -> Toolbelt:
+    """
+    Get the toolbelt of an investigation, loading it on first use.
+
+    The live session is looked up on every call (a dictionary hit while it is
+    active); if it was re-established since the tools were loaded, or the
+    toolbelt has outlived its TTL, the tools are reloaded and re-bound.
+    """
+    key = (task_id, session_output_dir)
+    # MCP Playwright will automatically create task_url_{task_id} directory for screenshots and traces
+    session = await get_mcp_session(task_id, session_output_dir)
+    now = time.monotonic()
+    belt = _toolbelt_cache.get(key)
+    if belt is not None and belt.session is session and now - belt.loaded_at < URL_INVESTIGATION_TOOLBELT_TTL:
+        return belt
+    if belt is not None and belt.session is not session:
+        logger.debug("MCP session for task {task_id} was reconnected, reloading tools", agent="URLInvestigation", node="get_task_toolbelt", task_id=task_id)
+
+    # Drop toolbelts of investigations that ended without being evicted
+    for stale_key in [k for k, b in _toolbelt_cache.items() if now - b.loaded_at >= URL_INVESTIGATION_TOOLBELT_TTL]:
+        del _toolbelt_cache[stale_key]
+
+    logger.debug("Loading MCP tools", agent="URLInvestigation", node="get_task_toolbelt")
+    mcp_tools = await load_mcp_tools_async(session)
+    all_tools = mcp_tools + [domain_whois]
+    if THINKING_TOOL_ENABLED:
+        all_tools.append(think_tool)
+        logger.debug("Thinking tool enabled and added to toolset", agent="URLInvestigation", node="get_task_toolbelt")
+    logger.debug("Loaded {tool_count} tools for investigation", agent="URLInvestigation", node="get_task_toolbelt", tool_count=len(all_tools))
+
+    belt = Toolbelt(
+        session=session,
+        mcp_tools=mcp_tools,
+        all_tools=all_tools,
+        # Read-only view: the mapping is shared by every turn of the investigation
+        tool_by_name=MappingProxyType({tool.name: tool for tool in all_tools}),
+        model_with_tools=get_llm("url_investigation_investigator_llm").bind_tools(all_tools),
+    )
+    _toolbelt_cache[key] = belt
+    return belt
+
+
+def evict_task_toolbelt(task_id: str, session_output_dir: str):
+    """Release the cached toolbelt of a finished investigation."""
+    _toolbelt_cache.pop((task_id, session_output_dir), None)
+
+
+# Exact-match cache of investigator responses keyed by a digest of the message history (LRU order)
+_INVESTIGATOR_CACHE: "OrderedDict[str, object]" = OrderedDict()
+
+# The briefing's timestamp line changes every second - it is left out of the cache key
+_TIMESTAMP_LINE_RE = re.compile(r"^[ \t]*Current date and time:.*$", re.MULTILINE)
+
+
+def _history_key(messages) -> str:
+    """Digest of the fields that determine the investigator's next step (ignoring the briefing timestamp)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for msg in messages:
+        content = _TIMESTAMP_LINE_RE.sub("", msg.content) if msg.type == "human" and isinstance(msg.content, str) else msg.content
+        digest.update(orjson.dumps(
+            [msg.type, content, getattr(msg, "tool_calls", None), getattr(msg, "tool_call_id", None)],
+            default=str
+        ))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+async def _invoke_investigator(model_with_tools, messages):
+    """
+    Invoke the investigator LLM, reusing the response for a message history already seen.
+
+    Identical histories (e.g. the same URL investigated again in this process,
+    or a retried step) return the cached AIMessage instead of a new LLM call.
+    """
+    key = _history_key(messages)
+    cached = _INVESTIGATOR_CACHE.get(key)
+    if cached is not None:
+        _INVESTIGATOR_CACHE.move_to_end(key)
+        logger.debug("Investigator response served from cache", agent="URLInvestigation", node="investigate_url", event_type="LLM_CACHE_HIT")
+        return cached
+
+    response = await model_with_tools.ainvoke(messages)
+    _INVESTIGATOR_CACHE[key] = response
+    if len(_INVESTIGATOR_CACHE) > URL_INVESTIGATION_LLM_CACHE_SIZE:
+        _INVESTIGATOR_CACHE.popitem(last=False)
+    return response
+
 
 
+def _head_tail(content: str, limit: int) -> str:
+    """
+    Cut text longer than `limit` to its start and end.
+
+    Page dumps put navigation at the top and scripts/redirect logic at the
+    bottom, so both ends are kept instead of only the first `limit` characters.
+    """
+    if len(content) <= limit:
+        return content
+    half = limit // 2
+    return f"{content[:half]}\n... [{len(content) - 2 * half} chars omitted] ...\n{content[len(content) - half:]}"
+
+
+def _spill_observation(content: str, task_investigation_dir: str) -> str:
+    """
+    Persist an oversized tool output to the task directory and return the text that replaces it.
+
+    Files are content-addressed, so an output is written only once however many turns it is compacted.
+    """
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+    path = os.path.join(task_investigation_dir, f"obs_{digest}.txt")
+    if not os.path.exists(path):
+        os.makedirs(task_investigation_dir, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+    return (
+        f"[Earlier tool output of {len(content)} characters stored at {path}. "
+        f"Preview of its start and end ({URL_INVESTIGATION_SPILL_PREVIEW_CHARS} characters):]\n"
+        f"{_head_tail(content, URL_INVESTIGATION_SPILL_PREVIEW_CHARS)}"
+    )
+
+
+def _compact_history(messages: list, task_investigation_dir: str) -> list:
+    """
+    Build the investigator prompt with older oversized tool outputs spilled to disk.
+
+    The trailing tool messages (the batch the investigator is about to act on)
+    are always kept whole - page snapshots carry the element refs it needs for
+    the next click.
+    """
+    latest_batch_start = len(messages)
+    while latest_batch_start > 0 and messages[latest_batch_start - 1].type == "tool":
+        latest_batch_start -= 1
+
+    compacted = []
+    for index, msg in enumerate(messages):
+        if (
+            index < latest_batch_start
+            and msg.type == "tool"
+            and isinstance(msg.content, str)
+            and len(msg.content) > URL_INVESTIGATION_SPILL_THRESHOLD
+        ):
+            msg = msg.model_copy(update={"content": _spill_observation(msg.content, task_investigation_dir)})
+        compacted.append(msg)
+    return compacted
+
 
 async def investigate_url(state: URLInvestigatorState):
     """Analyze current state and decide on tool usage with MCP integration.
@@ -70,25 +316,12 @@ async def investigate_url(state: URLInvestigatorState):
             node="investigate_url"
         )
 
-        # Generate unique task ID for this investigation to ensure session isolation
-        task_id = f"url_{abs(hash(url_task.url))}"
-        logger.debug(f"Generated task ID: {task_id}", agent="URLInvestigation", node="investigate_url")
+        # Unique task ID for this investigation to ensure session isolation (precomputed at dispatch)
+        task_id = state.get("task_id") or get_url_task_id(url_task.url)
+        logger.debug("Generated task ID: {task_id}", agent="URLInvestigation", node="investigate_url", task_id=task_id)
 
-        # MCP Playwright will automatically create task_url_{task_id} directory for screenshots and traces
-        # Get the task-specific MCP session and load tools fresh each time
-        from ...shared.utils.mcp_client import get_mcp_session
-        
-        logger.debug(f"Getting MCP session for task: {task_id}", agent="URLInvestigation", node="investigate_url")
-        session = await get_mcp_session(task_id, session_output_dir)
-        logger.debug("Loading MCP tools", agent="URLInvestigation", node="investigate_url")
-        mcp_tools = await load_mcp_tools_async(session)
-        all_tools = mcp_tools + [domain_whois]
-        if THINKING_TOOL_ENABLED:
-            from pdf_hunter.shared.tools import think_tool
-            all_tools.append(think_tool)
-            logger.debug("Thinking tool enabled and added to toolset", agent="URLInvestigation", node="investigate_url")
-        logger.debug(f"Loaded {len(all_tools)} tools for investigation", agent="URLInvestigation", node="investigate_url")
-        model_with_tools = url_investigation_investigator_llm.bind_tools(all_tools)
+        # Reuse the session, tools and bound model across turns of this investigation
+        model_with_tools = (await _get_task_toolbelt(task_id, session_output_dir)).model_with_tools
 
         messages = state.get("investigation_logs", [])
         if not messages:
@@ -110,12 +343,12 @@ async def investigate_url(state: URLInvestigatorState):
             
             **IMPORTANT:** This URL was extracted from a PDF document, not discovered on a website. The PDF may have used social engineering tactics (like fake verification prompts) to trick users into visiting this URL. Your investigation should focus on where this URL leads and whether it's part of a larger attack chain.
             """
-            initial_messages = [ SystemMessage(content=URL_INVESTIGATION_INVESTIGATOR_SYSTEM_PROMPT), HumanMessage(content=initial_prompt) ]
+            initial_messages = [ _INVESTIGATOR_SYSTEM_MSG, HumanMessage(content=initial_prompt) ]
             logger.debug("Created initial investigation prompt", agent="URLInvestigation", node="investigate_url")
             
             # Get the LLM response asynchronously - proper async pattern
             logger.debug("Invoking investigator LLM", agent="URLInvestigation", node="investigate_url")
-            llm_response = await model_with_tools.ainvoke(initial_messages)
+            llm_response = await _invoke_investigator(model_with_tools, initial_messages)
             logger.debug("Received LLM response for initial investigation", agent="URLInvestigation", node="investigate_url")
             
             # Return both the initial messages AND the LLM response
@@ -123,8 +356,11 @@ async def investigate_url(state: URLInvestigatorState):
         
         else:
             # For subsequent calls, use existing messages and add only the new response
-            logger.debug(f"🔄 Continuing investigation chain, turn {len(messages) // 2}", agent="URLInvestigation", node="investigate_url")
-            llm_response = await model_with_tools.ainvoke(messages)
+            logger.debug("🔄 Continuing investigation chain, turn {turn}", agent="URLInvestigation", node="investigate_url", turn=len(messages) // 2)
+            # Older oversized tool outputs are replaced by a preview + file reference in the prompt only;
+            # the state keeps the full log for the analyst
+            prompt_messages = await asyncio.to_thread(_compact_history, messages, _task_investigation_dir(session_output_dir, task_id))
+            llm_response = await _invoke_investigator(model_with_tools, prompt_messages)
             logger.debug("Received LLM response for continued investigation", agent="URLInvestigation", node="investigate_url")
             return {"investigation_logs": [llm_response]}
     
@@ -146,11 +382,11 @@ async def execute_browser_tools(state: URLInvestigatorState):
             return {"errors": ["No investigation logs available for tool execution"]}
             
         last_message = investigation_logs[-1]
-        if not hasattr(last_message, "tool_calls") or not last_message.tool_calls:
+        if not getattr(last_message, "tool_calls", None):
             logger.warning("No tool calls found in the last message", agent="URLInvestigation", node="execute_browser_tools")
             return {"investigation_logs": [ToolMessage(content="No tool calls were found to execute.", tool_call_id="none")]}
         
-        tool_calls = last_message.tool_calls
+        tool_calls = [_normalize_tool_call(tool_call) for tool_call in last_message.tool_calls]
         url_task = state.get("url_task")
         session_output_dir = state.get("output_directory")
         
@@ -169,45 +405,33 @@ async def execute_browser_tools(state: URLInvestigatorState):
             url=url_task.url
         )
 
-        # Generate the same task ID as used in investigate_url for session consistency
-        task_id = f"url_{abs(hash(url_task.url))}"
-
-        # MCP Playwright will automatically create task_url_{task_id} directory for screenshots and traces
+        # Same task ID as used in investigate_url for session consistency
+        task_id = state.get("task_id") or get_url_task_id(url_task.url)
 
         async def execute_tools():
             from langchain_core.tools.base import ToolException
             
-            # Get the task-specific MCP session and load tools fresh each time
-            from ...shared.utils.mcp_client import get_mcp_session
-            
-            logger.debug(f"Getting MCP session for tool execution: {task_id}", agent="URLInvestigation", node="execute_browser_tools")
-            session = await get_mcp_session(task_id, session_output_dir)
-            logger.debug("Loading MCP tools for execution", agent="URLInvestigation", node="execute_browser_tools")
-            mcp_tools = await load_mcp_tools_async(session)
-            tools = mcp_tools + [domain_whois]
-            if THINKING_TOOL_ENABLED:
-                from pdf_hunter.shared.tools.think_tool import think_tool
-                tools.append(think_tool)
-                logger.debug("Thinking tool enabled and added to execution toolset", agent="URLInvestigation", node="execute_browser_tools")
-            logger.debug(f"Loaded {len(tools)} tools for execution", agent="URLInvestigation", node="execute_browser_tools")
-            tool_by_name = {tool.name: tool for tool in tools}
-
-            # Execute tool calls (sequentially for reliability)
-            observations = []
-            for tool_call in tool_calls:
-                # Handle both dict and object formats for tool_call
-                tool_name = tool_call.get("name") if isinstance(tool_call, dict) else getattr(tool_call, "name")
+            # Same cached session and tools the investigator was bound to
+            tool_by_name = (await _get_task_toolbelt(task_id, session_output_dir)).tool_by_name
+
+            async def _invoke(tool_call):
+                """Run one tool call, returning the error text as the observation on failure."""
+                tool_name = tool_call.name
                 logger.info(f"🔧 Executing tool: {tool_name}", agent="URLInvestigation", node="execute_browser_tools", event_type="TOOL_CALL", tool_name=tool_name)
 
                 try:
                     tool = tool_by_name[tool_name]
-                    
-                    # Handle both dict and object formats for tool_call args
-                    tool_args = tool_call.get("args") if isinstance(tool_call, dict) else getattr(tool_call, "args")
+                    tool_args = tool_call.args
 
                     if tool_name == "domain_whois":
-                        # Use async invoke to prevent blocking
-                        observation = await asyncio.to_thread(tool.invoke, tool_args)
+                        # WHOIS is a deterministic lookup - serve repeats from the session cache (off the event loop)
+                        observation = await cached_invoke(
+                            tool,
+                            tool_args,
+                            ttl=URL_INVESTIGATION_WHOIS_CACHE_TTL,
+                            cache_dir=os.path.join(_url_investigation_dir(session_output_dir), ".mcp_cache"),
+                            should_cache=_is_cacheable_whois,
+                        )
                     elif tool_name == "think_tool":
                         # Use async invoke to prevent blocking
                         observation = await asyncio.to_thread(tool.invoke, tool_args)
@@ -227,38 +451,60 @@ async def execute_browser_tools(state: URLInvestigatorState):
                         observation = await tool.ainvoke(tool_args)
                         
                     logger.info(f"✅ Tool {tool_name} executed successfully", agent="URLInvestigation", node="execute_browser_tools", event_type="TOOL_SUCCESS", tool_name=tool_name)
-                    observations.append(observation)
+                    return observation
                     
                 except ToolException as e:
                     # Handle tool exceptions gracefully (e.g., network errors, invalid URLs)
                     error_msg = f"Tool execution failed: {str(e)}"
                     # Escape HTML/XML tags to prevent Loguru colorizer errors
-                    safe_error = str(e).replace('<', '{{').replace('>', '}}')
+                    safe_error = str(e).translate(_LOG_SAFE_TABLE)
                     logger.warning(f"⚠️ Tool {tool_name} execution failed: {safe_error}", agent="URLInvestigation", node="execute_browser_tools", event_type="TOOL_FAILURE", tool_name=tool_name)
-                    observations.append(error_msg)
+                    return error_msg
                     
                 except Exception as e:
                     # Handle any other unexpected errors
                     error_msg = f"Unexpected error in tool '{tool_name}': {str(e)}"
                     # Escape HTML/XML tags to prevent Loguru colorizer errors
-                    safe_error = str(e).replace('<', '{{').replace('>', '}}')
+                    safe_error = str(e).translate(_LOG_SAFE_TABLE)
                     logger.error(f"Unexpected error in tool {tool_name}: {safe_error}", agent="URLInvestigation", node="execute_browser_tools", event_type="TOOL_ERROR", tool_name=tool_name, exc_info=True)
-                    observations.append(error_msg)
+                    return error_msg
+
+            # Browser tools drive a single page, so they keep the order the investigator chose;
+            # independent local tools (WHOIS, think) run concurrently alongside that chain
+            observations = [None] * len(tool_calls)
+            # Bounds how many local tool calls (each occupying a worker thread) run at once
+            local_tool_slots = asyncio.Semaphore(URL_INVESTIGATION_MAX_CONCURRENT_TOOLS)
+
+            async def _run_at(index):
+                observations[index] = await _invoke(tool_calls[index])
+
+            async def _run_local(index):
+                async with local_tool_slots:
+                    await _run_at(index)
+
+            async def _run_browser_chain(indices):
+                for index in indices:
+                    await _run_at(index)
+
+            browser_indices = []
+            local_indices = []
+            for index, tool_call in enumerate(tool_calls):
+                (local_indices if tool_call.name in _LOCAL_TOOL_NAMES else browser_indices).append(index)
 
-            # Create tool output messages, handling both dict and object formats
+            await asyncio.gather(_run_browser_chain(browser_indices), *(_run_local(index) for index in local_indices))
+
+            # Create tool output messages
             tool_outputs = []
             for observation, tool_call in zip(observations, tool_calls):
-                tool_name = tool_call.get("name") if isinstance(tool_call, dict) else getattr(tool_call, "name")
-                tool_call_id = tool_call.get("id") if isinstance(tool_call, dict) else getattr(tool_call, "id")
                 tool_outputs.append(
                     ToolMessage(
                         content=observation,
-                        name=tool_name,
-                        tool_call_id=tool_call_id
+                        name=tool_call.name,
+                        tool_call_id=tool_call.id
                     )
                 )
             
-            logger.debug(f"Created {len(tool_outputs)} tool messages", agent="URLInvestigation", node="execute_browser_tools")
+            logger.debug("Created {tool_count} tool messages", agent="URLInvestigation", node="execute_browser_tools", tool_count=len(tool_outputs))
             return tool_outputs
         
         logger.debug("Executing all tools", agent="URLInvestigation", node="execute_browser_tools")
@@ -281,7 +527,7 @@ async def execute_browser_tools(state: URLInvestigatorState):
         return {"errors": [error_msg]}
 
 
-async def summarize_investigation_log(investigation_log: list, mission: dict) -> str:
+async def summarize_investigation_log(investigation_log: list, mission_reason: str) -> str:
     """
     Summarize verbose investigation log for analyst consumption.
 
@@ -290,52 +536,26 @@ async def summarize_investigation_log(investigation_log: list, mission: dict) ->
 
     Args:
         investigation_log: List of BaseMessage objects from investigation
-        mission: Mission context dict with reason_flagged
+        mission_reason: Why the URL was flagged (the mission context)
 
     Returns:
-        Compressed narrative summary as JSON string (for analyst prompt)
+        Compressed narrative summary for the analyst prompt (the columnar log table if summarization fails)
     """
-    from pdf_hunter.config import report_generator_llm  # Use existing summarization-capable model
+    report_generator_llm = get_llm("report_generator_llm")  # Use existing summarization-capable model
 
+    # Template rather than f-string: Loguru only formats it when DEBUG records are emitted
     logger.debug(
-        f"Summarizing investigation log: {len(investigation_log)} messages",
+        "Summarizing investigation log: {message_count} messages",
         agent="URLInvestigation",
         node="summarize_investigation_log",
         message_count=len(investigation_log)
     )
 
-    # Build readable log preview
-    log_text_parts = []
-    ai_turn = 0
-
-    for i, msg in enumerate(investigation_log):
-        if msg.type == "ai":
-            ai_turn += 1
-            log_text_parts.append(f"\n=== Investigator Turn {ai_turn} ===")
-
-            # Include investigator's reasoning if present
-            if hasattr(msg, "content") and msg.content:
-                reasoning = msg.content[:500] if len(msg.content) > 500 else msg.content
-                log_text_parts.append(f"Reasoning: {reasoning}")
-
-            # Include tool calls
-            if hasattr(msg, "tool_calls") and msg.tool_calls:
-                tool_names = [tc.get("name", "unknown") if isinstance(tc, dict) else getattr(tc, "name", "unknown") for tc in msg.tool_calls]
-                log_text_parts.append(f"Tools called: {', '.join(tool_names)}")
-
-        elif msg.type == "tool":
-            tool_name = getattr(msg, "name", "unknown")
-            log_text_parts.append(f"\nTool: {tool_name}")
-
-            # Include preview of tool response (first 500 chars)
-            content_preview = msg.content[:500] + "..." if len(msg.content) > 500 else msg.content
-            log_text_parts.append(f"Response preview: {content_preview}")
-
-    full_log_text = "\n".join(log_text_parts)
+    full_log_text = _compact_log_text(investigation_log)
 
     # Build summarization prompt from template
     summary_prompt = URL_INVESTIGATION_LOG_SUMMARIZATION_PROMPT.format(
-        mission_reason=mission.get('reason_flagged', 'URL investigation'),
+        mission_reason=mission_reason or 'URL investigation',
         investigation_log=full_log_text
     )
 
@@ -348,13 +568,17 @@ async def summarize_investigation_log(investigation_log: list, mission: dict) ->
 
         summarized_narrative = response.content
 
+        original_size = len(full_log_text)
+        summarized_size = len(summarized_narrative)
+        # An empty log (no AI or tool messages) would otherwise divide by zero
+        compression_ratio = (1 - summarized_size / original_size) * 100 if original_size else 0.0
         logger.info(
-            f"✅ Investigation log summarized: {len(full_log_text)} chars → {len(summarized_narrative)} chars",
+            f"✅ Investigation log summarized: {original_size} chars → {summarized_size} chars",
             agent="URLInvestigation",
             node="summarize_investigation_log",
-            original_size=len(full_log_text),
-            summarized_size=len(summarized_narrative),
-            compression_ratio=f"{(1 - len(summarized_narrative)/len(full_log_text))*100:.1f}%"
+            original_size=original_size,
+            summarized_size=summarized_size,
+            compression_ratio=f"{compression_ratio:.1f}%"
         )
 
         return summarized_narrative
@@ -366,8 +590,87 @@ async def summarize_investigation_log(investigation_log: list, mission: dict) ->
             node="summarize_investigation_log",
             exc_info=True
         )
-        # Fallback: return full log as JSON (analyst still works, just with more tokens)
-        return json.dumps([msg.model_dump() for msg in investigation_log], indent=2)
+        # Fallback: return the full log as the columnar table (analyst still works, just with more tokens)
+        return await asyncio.to_thread(_format_log_table, investigation_log)
+
+
+def _compact_log_text(investigation_log: list, preview_chars: int = URL_INVESTIGATION_LOG_PREVIEW_CHARS) -> str:
+    """
+    Build the turn-by-turn log preview given to the summarizer.
+
+    Keeps the investigator's reasoning and tool names per turn, and the first
+    `preview_chars` characters of each reasoning text and tool response.
+    """
+    log_text_parts = []
+    ai_turn = 0
+
+    for msg in investigation_log:
+        if msg.type == "ai":
+            ai_turn += 1
+            log_text_parts.append(f"\n=== Investigator Turn {ai_turn} ===")
+
+            # Include investigator's reasoning if present
+            if hasattr(msg, "content") and msg.content:
+                log_text_parts.append(f"Reasoning: {msg.content[:preview_chars]}")
+
+            # Include tool calls
+            if hasattr(msg, "tool_calls") and msg.tool_calls:
+                tool_names = [_normalize_tool_call(tc).name for tc in msg.tool_calls]
+                log_text_parts.append(f"Tools called: {', '.join(tool_names)}")
+
+        elif msg.type == "tool":
+            tool_name = getattr(msg, "name", "unknown")
+            log_text_parts.append(f"\nTool: {tool_name}")
+
+            # Include preview of tool response
+            # Slicing never copies more than preview_chars, whatever the output size
+            suffix = "..." if len(msg.content) > preview_chars else ""
+            log_text_parts.append(f"Response preview: {msg.content[:preview_chars]}{suffix}")
+
+    return "\n".join(log_text_parts)
+
+
+def _escape_cell(value) -> str:
+    """Escape a value for a single `|`-delimited table cell."""
+    return str(value).replace("\\", "\\\\").replace("|", "\\|").replace("\n", "\\n")
+
+
+def _format_log_table(investigation_log: list, max_tool_chars: int = URL_INVESTIGATION_ANALYST_TOOL_CHARS) -> str:
+    """
+    Render the investigation log as a columnar table for the analyst prompt.
+
+    The header names the columns once and each message becomes one
+    `|`-delimited row, instead of repeating every key per message as
+    indented JSON does. Tool outputs (accessibility trees, HTML) are cut to
+    their first and last `max_tool_chars // 2` characters; the full text stays
+    in the report's investigation log.
+    """
+    rows = ["idx|role|name|tool_call_id|tool_calls|content"]
+    for idx, msg in enumerate(investigation_log):
+        tool_calls = getattr(msg, "tool_calls", None)
+        tool_calls_cell = orjson.dumps([{"name": tc["name"], "args": tc["args"]} for tc in tool_calls], default=str).decode() if tool_calls else ""
+        content = str(msg.content)
+        if msg.type == "tool":
+            content = _head_tail(content, max_tool_chars)
+        rows.append("|".join((
+            str(idx),
+            msg.type,
+            _escape_cell(getattr(msg, "name", None) or ""),
+            _escape_cell(getattr(msg, "tool_call_id", "")),
+            _escape_cell(tool_calls_cell),
+            _escape_cell(content),
+        )))
+    return "\n".join(rows)
+
+
+def _has_successful_tool_output(investigation_log: list) -> bool:
+    """True if at least one tool call returned an observation rather than an execution error."""
+    return any(
+        msg.type == "tool"
+        and getattr(msg, "tool_call_id", None) != "none"
+        and not str(msg.content).startswith(_TOOL_ERROR_PREFIXES)
+        for msg in investigation_log
+    )
 
 
 # --- Node 2: Analyst ---
@@ -393,7 +696,36 @@ async def analyze_url_content(state: URLInvestigatorState) -> dict:
             log_messages=len(investigation_log)
         )
 
-        analyst_llm = url_investigation_analyst_llm.with_structured_output(AnalystFindings)
+        if not _has_successful_tool_output(investigation_log):
+            # Nothing was observed - there is no evidence for the analyst LLM to synthesize
+            last_reasoning = next((msg.content for msg in reversed(investigation_log) if msg.type == "ai" and msg.content), "")
+            analyst_findings = AnalystFindings(
+                final_url=url_task.url,
+                verdict="Inaccessible",
+                confidence=0.0,
+                summary=f"The investigation ended without any successful tool output, so the URL could not be examined. Investigator's last note: {last_reasoning or 'none'}",
+                detected_threats=[],
+                mission_status="failed"
+            )
+            url_task.mission_status = URLMissionStatus.FAILED
+            logger.info(
+                f"📊 Analysis skipped | No successful tool output for: {url_task.url}",
+                agent="URLInvestigation",
+                node="analyze_url_content",
+                event_type="ANALYSIS_SKIPPED",
+                url=url_task.url,
+                mission_status=URLMissionStatus.FAILED.value
+            )
+            return {"link_analysis_final_report": URLAnalysisResult(
+                initial_url=url_task,
+                full_investigation_log=[msg.model_dump() for msg in investigation_log],
+                analyst_findings=analyst_findings
+            )}
+
+        # Dump the messages for the final report in a worker thread while the analyst runs
+        full_investigation_log_task = asyncio.create_task(
+            asyncio.to_thread(lambda: [msg.model_dump() for msg in investigation_log])
+        )
 
         # Summarize investigation log if it's long (more than ~2-3 turns = >5 messages)
         # This reduces context window usage for the analyst without losing key findings
@@ -404,9 +736,9 @@ async def analyze_url_content(state: URLInvestigatorState) -> dict:
                 node="analyze_url_content",
                 message_count=len(investigation_log)
             )
-            investigation_log_json = await summarize_investigation_log(
+            investigation_log_text = await summarize_investigation_log(
                 investigation_log,
-                url_task.model_dump()  # Pass mission context
+                url_task.reason  # Pass mission context
             )
         else:
             logger.debug(
@@ -415,24 +747,39 @@ async def analyze_url_content(state: URLInvestigatorState) -> dict:
                 node="analyze_url_content",
                 message_count=len(investigation_log)
             )
-            investigation_log_json = json.dumps([msg.model_dump() for msg in investigation_log], indent=2)
+            # Format off the event loop - tool outputs (snapshots, HTML) can be large
+            investigation_log_text = await asyncio.to_thread(_format_log_table, investigation_log)
 
         logger.debug("Creating analyst prompt", agent="URLInvestigation", node="analyze_url_content")
+        # Built once per analysis; compact JSON - the LLM does not need the briefing pretty-printed
+        now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         analyst_prompt = URL_INVESTIGATION_ANALYST_USER_PROMPT.format(
-            current_datetime=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            initial_briefing_json=url_task.model_dump_json(indent=2),
-            investigation_log_json=investigation_log_json
+            current_datetime=now_str,
+            initial_briefing_json=url_task.model_dump_json(),
+            investigation_log=investigation_log_text
         )
         
         logger.debug("Invoking analyst LLM for findings synthesis", agent="URLInvestigation", node="analyze_url_content")
-        # Add timeout protection to prevent infinite hangs on analyst LLM calls
-        analyst_findings = await asyncio.wait_for(
-            analyst_llm.ainvoke([
-                SystemMessage(content=URL_INVESTIGATION_ANALYST_SYSTEM_PROMPT),
+        async def _stream_findings():
+            # Stream the structured output and keep the last (complete) value
+            findings = None
+            async for chunk in _get_analyst_llm().astream([
+                _ANALYST_SYSTEM_MSG,
                 HumanMessage(content=analyst_prompt)
-            ]),
-            timeout=LLM_TIMEOUT_TEXT
-        )
+            ]):
+                if chunk is not None:
+                    findings = chunk
+            return findings
+
+        # Add timeout protection to prevent infinite hangs on analyst LLM calls
+        try:
+            analyst_findings = await asyncio.wait_for(_stream_findings(), timeout=LLM_TIMEOUT_TEXT)
+        except BaseException:
+            full_investigation_log_task.cancel()
+            raise
+        if analyst_findings is None:
+            full_investigation_log_task.cancel()
+            raise ValueError("Analyst LLM returned no findings")
 
         new_status = URLMissionStatus.COMPLETED if analyst_findings.mission_status == "completed" else URLMissionStatus.FAILED
         url_task.mission_status = new_status
@@ -455,7 +802,7 @@ async def analyze_url_content(state: URLInvestigatorState) -> dict:
 
         link_analysis_final_report = URLAnalysisResult(
             initial_url=url_task,
-            full_investigation_log=[msg.model_dump() for msg in investigation_log],
+            full_investigation_log=await full_investigation_log_task,
             analyst_findings=analyst_findings
         )
         
@@ -502,8 +849,8 @@ def should_continue(state: URLInvestigatorState) -> Literal["execute_browser_too
     
     url = state["url_task"].url
     
-    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-        logger.debug(f"URL {url}: Tool calls found, continuing with tool execution", agent="URLInvestigation", node="should_continue")
+    if getattr(last_message, "tool_calls", None):
+        logger.debug("URL {url}: Tool calls found, continuing with tool execution", agent="URLInvestigation", node="should_continue", url=url)
         return "execute_browser_tools"
     
     logger.info(f"URL {url}: No more tool calls, proceeding to analysis", agent="URLInvestigation", node="should_continue", event_type="ROUTING_TO_ANALYSIS")
@@ -527,11 +874,12 @@ def route_url_analysis(state: URLInvestigationState):
         )
         
         for url in high_priority_urls:
-            logger.debug(f"Preparing to analyze URL: {url.url} (priority: {url.priority})", agent="URLInvestigation", node="route_url_analysis")
+            logger.debug("Preparing to analyze URL: {url} (priority: {priority})", agent="URLInvestigation", node="route_url_analysis", url=url.url, priority=url.priority)
             
         return [Send("conduct_link_analysis", {
             "url_task": url,
-            "output_directory": state["output_directory"]
+            "output_directory": state["output_directory"],
+            "task_id": get_url_task_id(url.url)
         }) for url in high_priority_urls]
     
     logger.info("No high priority URLs found for analysis", agent="URLInvestigation", node="route_url_analysis", event_type="NO_URLS_TO_ANALYZE")
@@ -562,18 +910,17 @@ async def filter_high_priority_urls(state: URLInvestigationState):
                 logger.debug(f"Found {len(all_priority_urls)} URLs in object format report", agent="URLInvestigation", node="filter_high_priority_urls")
 
             if all_priority_urls:
-                high_priority_count = 0
-                low_priority_count = 0
-                
-                for url in all_priority_urls:
-                    if url.priority <= URL_INVESTIGATION_PRIORITY_LEVEL:
-                        url.mission_status = URLMissionStatus.IN_PROGRESS
-                        high_priority_urls.append(url)
-                        high_priority_count += 1
-                        logger.debug(f"Selected high priority URL: {url.url} (priority: {url.priority})", agent="URLInvestigation", node="filter_high_priority_urls")
-                    else:
-                        url.mission_status = URLMissionStatus.NOT_RELEVANT
-                        low_priority_count += 1
+                # Partition by priority threshold, then mark each side in a single pass
+                high_priority_urls = [url for url in all_priority_urls if url.priority <= URL_INVESTIGATION_PRIORITY_LEVEL]
+                low_priority_urls = [url for url in all_priority_urls if url.priority > URL_INVESTIGATION_PRIORITY_LEVEL]
+                for url in high_priority_urls:
+                    url.mission_status = URLMissionStatus.IN_PROGRESS
+                    logger.debug("Selected high priority URL: {url} (priority: {priority})", agent="URLInvestigation", node="filter_high_priority_urls", url=url.url, priority=url.priority)
+                for url in low_priority_urls:
+                    url.mission_status = URLMissionStatus.NOT_RELEVANT
+
+                high_priority_count = len(high_priority_urls)
+                low_priority_count = len(low_priority_urls)
                         
                 logger.info(
                     f"🔎 Filtered URLs: {high_priority_count} high priority (≤{URL_INVESTIGATION_PRIORITY_LEVEL}), {low_priority_count} low priority (>{URL_INVESTIGATION_PRIORITY_LEVEL}) out of {len(all_priority_urls)} total",
@@ -610,7 +957,7 @@ async def save_url_analysis_state(state: URLInvestigationState):
         logger.debug(f"Session ID: {session_id} | Output: {session_output_dir}", agent="URLInvestigation", node="save_url_analysis_state")
 
         # Create url investigation subdirectory
-        url_investigation_directory = os.path.join(session_output_dir, "url_investigation")
+        url_investigation_directory = _url_investigation_dir(session_output_dir)
         await asyncio.to_thread(os.makedirs, url_investigation_directory, exist_ok=True)
 
         json_filename = f"url_investigation_state_session_{session_id}.json"
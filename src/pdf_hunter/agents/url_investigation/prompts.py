@@ -104,9 +104,9 @@ Conduct a full forensic analysis of the provided investigation log and generate
 ```
 
 **2. Full Investigation Log (The "Detective's Notebook" from the interactive pursuit):**
-This is the complete, time-ordered log of every thought, action, and tool output from the field investigator.
-```json
-{investigation_log_json}
+This is the complete, time-ordered log of every thought, action, and tool output from the field investigator. It is either a table (the first line names the columns, then one `|`-separated row per message, with literal `|`, `\\` and newlines escaped as `\\|`, `\\\\` and `\\n`) or, for long investigations, a condensed narrative of the same log.
+```
+{investigation_log}
 ```
 
 **Your Mission**:
@@ -58,6 +58,7 @@ class URLInvestigatorState(TypedDict):
     url_task: PrioritizedURL
     output_directory: str
     session_id: str        # Added for session management
+    task_id: NotRequired[str]  # MCP session / task directory key, computed once at dispatch
 
     # Intermediate
     investigation_logs: Annotated[Sequence[BaseMessage], operator.add]
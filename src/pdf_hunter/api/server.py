@@ -5,14 +5,15 @@ Provides real-time log streaming via Server-Sent Events for the web dashboard.
 """
 import asyncio
 import hashlib
+import json
 import os
 import re
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Query
 from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
@@ -20,11 +21,29 @@ from loguru import logger
 from pdf_hunter.config.logging_config import (
     setup_logging,
     add_sse_client,
-    remove_sse_client
+    remove_sse_client,
+    dropped_messages,
+    MAX_QUEUE_SIZE
 )
+from pdf_hunter.config.execution_config import API_MAX_CONCURRENT_ANALYSES
+
+if TYPE_CHECKING:
+    from pdf_hunter.orchestrator.schemas import OrchestratorInputState
 
 # Track active analysis tasks
-active_analyses = {}  # session_id -> {"status": str, "task": asyncio.Task}
+active_analyses = {}  # session_id -> {"status": str, "task": asyncio.Task, "done": asyncio.Event, "report_available": bool}
+
+# Caps how many orchestrator runs execute at once (see API_MAX_CONCURRENT_ANALYSES)
+_analysis_slots = asyncio.Semaphore(API_MAX_CONCURRENT_ANALYSES)
+
+# Session IDs are {sha1}_{YYYYMMDD}_{HHMMSS}
+SESSION_ID_RE = re.compile(r'[a-f0-9]{40}_[0-9]{8}_[0-9]{6}')
+
+# Read size for replaying session.jsonl - each chunk becomes one batch of SSE frames
+REPLAY_CHUNK_SIZE = 64 * 1024
+
+# Seconds without a live event before the stream sends a keepalive (and a diagnostic frame if events were dropped)
+SSE_KEEPALIVE_INTERVAL = 30.0
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -43,10 +62,52 @@ app.add_middleware(
 )
 
 
+# Orchestrator graph, imported on first use (see _get_graph)
+_orchestrator_graph = None
+
+
+def _get_graph():
+    """
+    Return the orchestrator graph, importing it on first use.
+
+    The import pulls in every agent and the LangChain/LangGraph stack, so it is
+    deferred out of module import (and the circular import with logging setup)
+    and warmed once at startup instead of on the first upload.
+    """
+    global _orchestrator_graph
+    if _orchestrator_graph is None:
+        from pdf_hunter.orchestrator.graph import orchestrator_graph
+        _orchestrator_graph = orchestrator_graph
+    return _orchestrator_graph
+
+
+async def _replay_log_frames(log_file: Path):
+    """
+    Yield SSE frames for every event in a session log.
+
+    The file is read in REPLAY_CHUNK_SIZE chunks off the event loop, and all
+    complete lines of a chunk are emitted as a single batch of frames.
+    """
+    f = await asyncio.to_thread(open, log_file, "rb")
+    try:
+        remainder = b""
+        while chunk := await asyncio.to_thread(f.read, REPLAY_CHUNK_SIZE):
+            *lines, remainder = (remainder + chunk).split(b"\n")
+            frames = "".join(f"data: {line.decode()}\n\n" for line in lines if line.strip())
+            if frames:
+                yield frames
+        if remainder.strip():
+            yield f"data: {remainder.decode()}\n\n"
+    finally:
+        await asyncio.to_thread(f.close)
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize logging with SSE enabled on server startup."""
     setup_logging(enable_sse=True)
+    # Import the orchestrator now so the first analysis does not pay for it
+    await asyncio.to_thread(_get_graph)
     logger.info("🚀 PDF Hunter API started with SSE streaming enabled", agent="api", node="startup")
 
 
@@ -63,7 +124,8 @@ async def root():
             "status": "/api/status",
             "analyze": "/api/analyze",
             "stream": "/api/sessions/{session_id}/stream",
-            "session_status": "/api/sessions/{session_id}/status"
+            "session_status": "/api/sessions/{session_id}/status",
+            "session_wait": "/api/sessions/{session_id}/wait"
         }
     }
 
@@ -122,12 +184,11 @@ async def analyze_pdf(
         
         # Create output directory structure
         output_dir = Path("output") / session_id
-        output_dir.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(output_dir.mkdir, parents=True, exist_ok=True)
         
-        # Save PDF to session directory
+        # Save PDF to session directory (off the event loop - uploads can be large)
         pdf_path = output_dir / file.filename
-        with open(pdf_path, 'wb') as f:
-            f.write(content)
+        await asyncio.to_thread(pdf_path.write_bytes, content)
         
         # Setup logging BEFORE orchestrator runs (includes session.jsonl)
         setup_logging(
@@ -155,6 +216,8 @@ async def analyze_pdf(
         active_analyses[session_id] = {
             "status": "running",
             "task": task,
+            "done": asyncio.Event(),
+            "report_available": False,
             "filename": file.filename,
             "started_at": datetime.now().isoformat()
         }
@@ -165,7 +228,8 @@ async def analyze_pdf(
             "filename": file.filename,
             "max_pages": max_pages,
             "stream_url": f"/api/sessions/{session_id}/stream",
-            "status_url": f"/api/sessions/{session_id}/status"
+            "status_url": f"/api/sessions/{session_id}/status",
+            "wait_url": f"/api/sessions/{session_id}/wait"
         }
         
     except Exception as e:
@@ -191,9 +255,7 @@ async def run_pdf_analysis(session_id: str, pdf_path: str, max_pages: int):
         max_pages: Maximum pages to analyze
     """
     try:
-        # Import here to avoid circular dependencies
-        from pdf_hunter.orchestrator.graph import orchestrator_graph
-        from pdf_hunter.orchestrator.schemas import OrchestratorInputState
+        orchestrator_graph = _get_graph()
         
         logger.info(
             f"🚀 Starting PDF analysis pipeline",
@@ -208,7 +270,7 @@ async def run_pdf_analysis(session_id: str, pdf_path: str, max_pages: int):
         output_directory = str(Path("output") / session_id)
         
         # Prepare initial state with pre-generated session_id
-        initial_state: OrchestratorInputState = {
+        initial_state: "OrchestratorInputState" = {
             "file_path": pdf_path,
             "output_directory": output_directory,
             "number_of_pages_to_process": max_pages,
@@ -216,23 +278,30 @@ async def run_pdf_analysis(session_id: str, pdf_path: str, max_pages: int):
             "session_id": session_id  # Pass pre-generated session_id
         }
         
+        if _analysis_slots.locked():
+            logger.info(
+                "⏳ Waiting for a free analysis slot",
+                agent="api",
+                node="run_pdf_analysis",
+                session_id=session_id,
+                max_concurrent_analyses=API_MAX_CONCURRENT_ANALYSES
+            )
+
         # Run the orchestrator (no streaming needed since logging is already setup)
-        final_result = await orchestrator_graph.ainvoke(initial_state)
+        async with _analysis_slots:
+            final_result = await orchestrator_graph.ainvoke(initial_state)
 
         # Save final state to JSON file (same as CLI)
         if final_result:
-            from pdf_hunter.shared.utils.serializer import serialize_state_safely
-            import json
+            from pdf_hunter.shared.utils.serializer import dump_state_to_file
 
             filename = f"analysis_report_session_{session_id}.json"
             json_path = Path(output_directory) / filename
 
-            # Convert final state to JSON-serializable format
-            serializable_state = serialize_state_safely(final_result)
-
-            # Save to JSON file
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(serializable_state, f, indent=2, ensure_ascii=False)
+            # Convert, encode and save in a worker thread
+            await dump_state_to_file(final_result, str(json_path))
+            if session_id in active_analyses:
+                active_analyses[session_id]["report_available"] = True
 
             logger.info(
                 f"📄 Final state saved to: {json_path}",
@@ -266,6 +335,10 @@ async def run_pdf_analysis(session_id: str, pdf_path: str, max_pages: int):
             session_id=session_id,
             exc_info=True
         )
+    finally:
+        # Wake up clients waiting on /wait
+        if session_id in active_analyses:
+            active_analyses[session_id]["done"].set()
 
 
 
@@ -284,7 +357,7 @@ async def stream_logs(session_id: str):
         StreamingResponse with text/event-stream content type
     """
     # Validate session_id format
-    if not re.match(r'^[a-f0-9]{40}_\d{8}_\d{6}$', session_id):
+    if not SESSION_ID_RE.fullmatch(session_id):
         raise HTTPException(400, "Invalid session ID format. Expected: {sha1}_{YYYYMMDD}_{HHMMSS}")
     
     async def event_generator():
@@ -301,11 +374,8 @@ async def stream_logs(session_id: str):
                 session_id=session_id
             )
             try:
-                with open(log_file, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            yield f"data: {line}\n\n"
-                            await asyncio.sleep(0)  # Allow other tasks to run
+                async for frames in _replay_log_frames(log_file):
+                    yield frames
             except Exception as e:
                 logger.error(
                     f"Failed to replay logs: {e}",
@@ -315,7 +385,7 @@ async def stream_logs(session_id: str):
                 )
         
         # Step 2: Stream live events from queue
-        queue = asyncio.Queue()
+        queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
         add_sse_client(session_id, queue)
         
         logger.info(
@@ -327,13 +397,17 @@ async def stream_logs(session_id: str):
         
         try:
             while True:
-                # Wait for next message with 30-second timeout
+                # Wait for next message, sending a keepalive when the stream is idle
                 try:
-                    message = await asyncio.wait_for(queue.get(), timeout=30.0)
+                    message = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_INTERVAL)
                     yield f"data: {message}\n\n"
                 except asyncio.TimeoutError:
                     # Send keepalive ping to prevent connection timeout
                     yield ": keepalive\n\n"
+                    # Comments never reach EventSource, so report events dropped for this slow client as a named event
+                    dropped = dropped_messages.get(queue, 0)
+                    if dropped:
+                        yield f"event: diagnostic\ndata: {json.dumps({'dropped': dropped})}\n\n"
         except asyncio.CancelledError:
             logger.info(
                 f"Client disconnected from session {session_id}",
@@ -367,7 +441,7 @@ async def get_session_status(session_id: str):
         Status: "running", "complete", "failed", or "not_found"
     """
     # Validate session_id format
-    if not re.match(r'^[a-f0-9]{40}_\d{8}_\d{6}$', session_id):
+    if not SESSION_ID_RE.fullmatch(session_id):
         raise HTTPException(400, "Invalid session ID format")
     
     # Check active analyses first
@@ -375,15 +449,13 @@ async def get_session_status(session_id: str):
         analysis_info = active_analyses[session_id]
         status = analysis_info["status"]
         
-        # Check if final report exists for "complete" status
-        report_path = Path(f"output/{session_id}/analysis_report_session_{session_id}.json")
-        
+        # Answered from memory - run_pdf_analysis records when the report is written
         return {
             "status": status,
             "session_id": session_id,
             "filename": analysis_info.get("filename"),
             "started_at": analysis_info.get("started_at"),
-            "report_available": report_path.exists(),
+            "report_available": analysis_info["report_available"],
             "stream_url": f"/api/sessions/{session_id}/stream"
         }
     
@@ -416,6 +488,34 @@ async def get_session_status(session_id: str):
     }
 
 
+@app.get("/api/sessions/{session_id}/wait")
+async def wait_for_session(session_id: str, timeout: float = Query(default=60.0, gt=0, le=600)):
+    """
+    Wait until an analysis finishes, then return its status.
+    
+    Lets clients get notified of completion instead of polling /status.
+    
+    Args:
+        session_id: Session ID to wait for
+        timeout: Maximum seconds to wait (default: 60, max: 600)
+        
+    Returns:
+        The same payload as /status; "running" if the timeout expired first
+    """
+    # Validate session_id format
+    if not SESSION_ID_RE.fullmatch(session_id):
+        raise HTTPException(400, "Invalid session ID format")
+    
+    analysis_info = active_analyses.get(session_id)
+    if analysis_info is not None:
+        try:
+            await asyncio.wait_for(analysis_info["done"].wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+    
+    return await get_session_status(session_id)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
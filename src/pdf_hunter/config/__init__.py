@@ -28,25 +28,22 @@ from .models_config import (
     # Model provider configs
     openai_config,
     azure_openai_config,
-    
-    # File Analysis Agent LLMs
-    file_analysis_triage_llm,
-    file_analysis_investigator_llm,
-    file_analysis_graph_merger_llm,
-    file_analysis_reviewer_llm,
-    file_analysis_finalizer_llm,
-    
-    # Image Analysis Agent LLMs
-    image_analysis_llm,
-    
-    # URL Investigation Agent LLMs
-    url_investigation_investigator_llm,
-    url_investigation_analyst_llm,
-    
-    # Report Generator Agent LLMs
-    report_generator_llm,
-    final_verdict_llm,
+    LLM_CONFIG,
+    make_llm,
+    get_llm,
+    model_for_role,
+    MODEL_TIERS,
+    ROLE_TIERS,
 )
+from . import models_config as _models_config
+
+
+def __getattr__(name: str):
+    # LLM instances (file_analysis_triage_llm, image_analysis_llm, ...) are built on first access
+    if name in _models_config._LLM_ROLES:
+        return _models_config.get_llm(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Execution configuration
@@ -65,6 +62,12 @@ __all__ = [
     # Model provider configs
     "openai_config",
     "azure_openai_config",
+    "LLM_CONFIG",
+    "make_llm",
+    "get_llm",
+    "model_for_role",
+    "MODEL_TIERS",
+    "ROLE_TIERS",
     
     # LLM instances
     "file_analysis_triage_llm",
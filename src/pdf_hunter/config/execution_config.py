@@ -58,6 +58,21 @@ IMAGE_ANALYSIS_CONFIG = {
     "recursion_limit": 15  # Per-page analysis workflow
 }
 
+# Analyze pages concurrently instead of one after another
+# Faster for multi-page documents, but each page is judged without the briefing from the previous pages
+IMAGE_ANALYSIS_PARALLEL_PAGES = False
+
+# Directory of the cross-session page verdict cache, keyed by a digest of the model, the page image and its full prompt
+# Opt-in: None always calls the vision LLM. A relative path (e.g. ".visual_cache") is resolved under the output root,
+# next to the session directories; delete the directory to invalidate
+IMAGE_ANALYSIS_PAGE_CACHE_DIR = None
+# How long (in seconds) a cached page verdict is reused
+IMAGE_ANALYSIS_PAGE_CACHE_TTL = 7 * 86400
+
+# Page images whose longest edge exceeds this many pixels are downscaled before being sent to the vision LLM
+# The model downsamples large images itself, so the extra pixels only cost upload and encode time; None sends pages as extracted
+IMAGE_ANALYSIS_MAX_IMAGE_EDGE = 1568
+
 # -- URL INVESTIGATION AGENT CONFIGURATION --
 # Browser automation with tool loops per URL
 URL_INVESTIGATION_CONFIG = {
@@ -74,6 +89,44 @@ URL_INVESTIGATION_INVESTIGATOR_CONFIG = {
 # Priority threshold for URL investigation (1=highest priority, 5=lowest)
 URL_INVESTIGATION_PRIORITY_LEVEL = 2
 
+# Wall-clock budget (in seconds) for one URL investigation, tool loop and analyst included
+# A hung site or browser tool is reported as a failed mission instead of stalling the batch
+URL_INVESTIGATION_TIMEOUT = 600
+
+# Maximum URL investigations (each with its own headless browser) running at the same time
+# Further flagged URLs wait for a free slot instead of oversubscribing CPU/RAM
+URL_INVESTIGATION_MAX_CONCURRENCY = 4
+
+# Maximum in-process tool calls (WHOIS, think) from one investigator turn running at the same time
+# Browser tools are always executed one at a time against the task's page
+URL_INVESTIGATION_MAX_CONCURRENT_TOOLS = 4
+
+# How long (in seconds) an investigation's loaded MCP tools and tool-bound model are kept
+# Entries of investigations that were never evicted (e.g. the subgraph run on its own) are dropped after this
+URL_INVESTIGATION_TOOLBELT_TTL = 600
+
+# How long (in seconds) a cached WHOIS response is reused within the session output directory
+URL_INVESTIGATION_WHOIS_CACHE_TTL = 86400
+
+# Investigator LLM responses kept in the in-process exact-match cache (keyed by message history)
+URL_INVESTIGATION_LLM_CACHE_SIZE = 128
+
+# Tool outputs larger than this (in characters) are spilled to the task directory once the investigator
+# has moved past them; later turns see only a preview and the file path
+URL_INVESTIGATION_SPILL_THRESHOLD = 16_384
+URL_INVESTIGATION_SPILL_PREVIEW_CHARS = 2_000
+
+# Per-message cap (in characters) on tool outputs shown to the analyst for short, unsummarized logs
+URL_INVESTIGATION_ANALYST_TOOL_CHARS = 4_000
+
+# Per-message preview length (in characters) of reasoning and tool outputs fed to the log summarizer
+URL_INVESTIGATION_LOG_PREVIEW_CHARS = 500
+
+# -- API SERVER CONFIGURATION --
+# Maximum analyses the API runs at the same time; further uploads wait for a free slot
+# Every analysis drives several LLM clients and browsers, so this also caps concurrent LLM traffic
+API_MAX_CONCURRENT_ANALYSES = 2
+
 # -- REPORT GENERATION AGENT CONFIGURATION --
 # Final report synthesis and verdict determination
 REPORT_GENERATION_CONFIG = {
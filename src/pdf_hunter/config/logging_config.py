@@ -35,6 +35,9 @@ connected_clients: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
 # Maximum queue size to prevent memory issues with slow clients
 MAX_QUEUE_SIZE = 1000
 
+# Events dropped per client queue because the client fell behind
+dropped_messages: Dict[asyncio.Queue, int] = {}
+
 
 async def sse_sink(message: str) -> None:
     """Async sink that routes log events to connected SSE clients.
@@ -57,16 +60,17 @@ async def sse_sink(message: str) -> None:
         if session_id in connected_clients:
             for queue in list(connected_clients[session_id]):
                 try:
-                    # Non-blocking put with size check
-                    if queue.qsize() < MAX_QUEUE_SIZE:
-                        queue.put_nowait(message)
-                    else:
-                        # Queue full - client too slow, skip this message
-                        logger.warning(
-                            f"SSE queue full for session {session_id}, dropping message",
-                            agent="system",
-                            node="sse_sink"
-                        )
+                    if queue.qsize() >= MAX_QUEUE_SIZE:
+                        # Queue full - client too slow, drop its oldest pending event so the latest progress gets through
+                        queue.get_nowait()
+                        dropped_messages[queue] = dropped_messages.get(queue, 0) + 1
+                        if dropped_messages[queue] == 1:
+                            logger.warning(
+                                f"SSE queue full for session {session_id}, dropping oldest messages",
+                                agent="system",
+                                node="sse_sink"
+                            )
+                    queue.put_nowait(message)
                 except Exception as e:
                     logger.error(
                         f"Failed to queue message for SSE client: {e}",
@@ -107,6 +111,7 @@ def remove_sse_client(session_id: str, queue: asyncio.Queue) -> None:
         session_id: Session ID being watched
         queue: Client queue to remove
     """
+    dropped_messages.pop(queue, None)
     if session_id in connected_clients:
         connected_clients[session_id].discard(queue)
         if not connected_clients[session_id]:
@@ -125,6 +130,16 @@ def remove_sse_client(session_id: str, queue: asyncio.Queue) -> None:
 # Main Logging Setup
 # ============================================================================
 
+# Terminal message color per log level (built once, looked up for every record)
+TERMINAL_LEVEL_COLORS = {
+    "DEBUG": "blue",
+    "INFO": "green",
+    "WARNING": "yellow",
+    "ERROR": "red",
+    "CRITICAL": "magenta",
+    "SUCCESS": "green"
+}
+
 
 def setup_logging(
     session_id: str | None = None,
@@ -194,15 +209,7 @@ def setup_logging(
         message = message.replace("{", "{{").replace("}", "}}")
         
         # Color formatting
-        colors = {
-            "DEBUG": "blue",
-            "INFO": "green",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "CRITICAL": "magenta",
-            "SUCCESS": "green"
-        }
-        color = colors.get(level, "white")
+        color = TERMINAL_LEVEL_COLORS.get(level, "white")
         
         return (
             f"<green>{timestamp}</green> | "
@@ -219,6 +226,7 @@ def setup_logging(
         colorize=True,
         backtrace=True,
         diagnose=True,
+        enqueue=True,  # Write from a background thread so stderr never blocks the event loop
     )
     
     # Central JSON file handler: Structured JSONL for querying across all sessions
@@ -1,6 +1,7 @@
 from pathlib import Path
 import os
 import subprocess
+from functools import lru_cache
 from langchain.chat_models import init_chat_model
 from dotenv import load_dotenv
 
@@ -68,54 +69,123 @@ azure_openai_config = {
 # Azure OpenAI works seamlessly with init_chat_model using model_provider="azure_openai"
 # The function will automatically use Azure-specific parameters when this provider is specified
 
+# === ACTIVE PROVIDER ===
+# The provider config every role is built from; set to azure_openai_config to run on Azure OpenAI
+LLM_CONFIG = openai_config
+
+# === MODEL TIERS ===
+# "fast" serves low-ambiguity classification hops, "standard" the open-ended reasoning roles
+# Fast-tier model per provider; a provider without one runs the fast roles on its configured model
+FAST_TIER_MODELS = {
+    "openai": "gpt-4.1-mini",
+    "azure_openai": os.getenv("AZURE_OPENAI_FAST_DEPLOYMENT_NAME"),
+}
+
+
+def tier_models(config: dict) -> dict:
+    """Map each tier to the model (or Azure deployment) it runs on for a provider config."""
+    return {
+        "fast": FAST_TIER_MODELS.get(config["model_provider"]) or config["model"],
+        "standard": config["model"],
+    }
+
+
+MODEL_TIERS = tier_models(LLM_CONFIG)
+
+# Roles that run on a tier other than "standard"
+ROLE_TIERS = {
+    "file_analysis_triage": "fast",
+    "final_verdict": "fast",
+}
+
+# Set PDF_HUNTER_FORCE_TIER=fast|standard to run every role on one tier (e.g. for A/B comparisons)
+FORCE_TIER = os.getenv("PDF_HUNTER_FORCE_TIER") or None
+if FORCE_TIER is not None and FORCE_TIER not in MODEL_TIERS:
+    raise ValueError(f"PDF_HUNTER_FORCE_TIER must be one of {sorted(MODEL_TIERS)}, got {FORCE_TIER!r}")
+
+
+def model_for_role(role: str) -> str:
+    """Return the model name an agent role runs on, without building the client."""
+    return MODEL_TIERS[FORCE_TIER or ROLE_TIERS.get(role, "standard")]
+
+
+def make_llm(role: str):
+    """
+    Build the chat model for one agent role, on the model of the role's tier.
+
+    Every request of a role carries the same prompt_cache_key, so OpenAI routes
+    calls that share the role's static system prompt to the same prompt cache.
+    """
+    return init_chat_model(
+        **{**LLM_CONFIG, "model": model_for_role(role)},
+        extra_body={"prompt_cache_key": f"pdf-hunter-{role}"},
+    )
+
+
 # LLMs - Each agent and task has its own dedicated LLM instance
 # Each model is optimized for specific analysis tasks and output formats
-
-# === PDF EXTRACTION AGENT ===
-# No LLM needed - handles image extraction and text parsing only
-
-# === FILE ANALYSIS AGENT ===
-# Triage: Maliciousness assessment based on static indicators 
-# Output: Structured TriageResult with confidence scores and analysis guidance
-file_analysis_triage_llm = init_chat_model(**openai_config)
-
-# Investigator: Deep dive into static file forensics using structured queries
-# Output: Structured InvestigationResult with detailed technical findings
-file_analysis_investigator_llm = init_chat_model(**openai_config)
-
-# Graph Merger: Merge overlapping findings into coherent analyses
-# Output: Structured MergedFindings with unified threat assessments
-file_analysis_graph_merger_llm = init_chat_model(**openai_config)
-
-# Reviewer: Strategic analysis and mission coordination decisions
-# Output: Structured ReviewerReport with investigation routing decisions
-file_analysis_reviewer_llm = init_chat_model(**openai_config)
-
-# Finalizer: Final threat assessment and autopsy report generation
-# Output: Structured FinalReport with comprehensive analysis summary
-file_analysis_finalizer_llm = init_chat_model(**openai_config)
-
-# === IMAGE ANALYSIS AGENT ===
-# Visual deception analysis of PDF page images with cross-page context
-# Output: Structured PageAnalysisResult with visual forensic findings and URL prioritization
-# Note: Processes base64 image data for visual threat detection
-image_analysis_llm = init_chat_model(**openai_config)
-
-# === URL INVESTIGATION AGENT ===
-# Investigator: Web reconnaissance using browser automation tools (with MCP tool binding)
-# Output: Investigation logs and browser interaction results
-# Note: Uses tools for web browsing, screenshots, and dynamic URL analysis
-url_investigation_investigator_llm = init_chat_model(**openai_config)
-
-# Analyst: Synthesis of link investigation findings and threat assessment
-# Output: Structured AnalystFindings with URL reputation and threat indicators
-url_investigation_analyst_llm = init_chat_model(**openai_config)
-
-# === REPORT GENERATOR AGENT ===
-# Reporter: Comprehensive markdown report generation from all agent findings
-# Output: Natural language markdown report for human consumption
-report_generator_llm = init_chat_model(**openai_config)
-
-# Final Verdict: Authoritative malicious/benign classification decision
-# Output: Structured FinalVerdict with confidence scores and reasoning
-final_verdict_llm = init_chat_model(**openai_config)
+# Models are built on first access (see get_llm), so entry points that never call an LLM
+# (e.g. PDF extraction on its own) do not construct any
+_LLM_ROLES = {
+    # === PDF EXTRACTION AGENT ===
+    # No LLM needed - handles image extraction and text parsing only
+
+    # === FILE ANALYSIS AGENT ===
+    # Triage: Maliciousness assessment based on static indicators 
+    # Output: Structured TriageResult with confidence scores and analysis guidance
+    "file_analysis_triage_llm": "file_analysis_triage",
+
+    # Investigator: Deep dive into static file forensics using structured queries
+    # Output: Structured InvestigationResult with detailed technical findings
+    "file_analysis_investigator_llm": "file_analysis_investigator",
+
+    # Graph Merger: Merge overlapping findings into coherent analyses
+    # Output: Structured MergedFindings with unified threat assessments
+    "file_analysis_graph_merger_llm": "file_analysis_graph_merger",
+
+    # Reviewer: Strategic analysis and mission coordination decisions
+    # Output: Structured ReviewerReport with investigation routing decisions
+    "file_analysis_reviewer_llm": "file_analysis_reviewer",
+
+    # Finalizer: Final threat assessment and autopsy report generation
+    # Output: Structured FinalReport with comprehensive analysis summary
+    "file_analysis_finalizer_llm": "file_analysis_finalizer",
+
+    # === IMAGE ANALYSIS AGENT ===
+    # Visual deception analysis of PDF page images with cross-page context
+    # Output: Structured PageAnalysisResult with visual forensic findings and URL prioritization
+    # Note: Processes base64 image data for visual threat detection
+    "image_analysis_llm": "image_analysis",
+
+    # === URL INVESTIGATION AGENT ===
+    # Investigator: Web reconnaissance using browser automation tools (with MCP tool binding)
+    # Output: Investigation logs and browser interaction results
+    # Note: Uses tools for web browsing, screenshots, and dynamic URL analysis
+    "url_investigation_investigator_llm": "url_investigation_investigator",
+
+    # Analyst: Synthesis of link investigation findings and threat assessment
+    # Output: Structured AnalystFindings with URL reputation and threat indicators
+    "url_investigation_analyst_llm": "url_investigation_analyst",
+
+    # === REPORT GENERATOR AGENT ===
+    # Reporter: Comprehensive markdown report generation from all agent findings
+    # Output: Natural language markdown report for human consumption
+    "report_generator_llm": "report_generator",
+
+    # Final Verdict: Authoritative malicious/benign classification decision
+    # Output: Structured FinalVerdict with confidence scores and reasoning
+    "final_verdict_llm": "final_verdict",
+}
+
+
+@lru_cache(maxsize=None)
+def get_llm(name: str):
+    """Return the LLM for an entry of _LLM_ROLES (e.g. "image_analysis_llm"), building it on first use."""
+    return make_llm(_LLM_ROLES[name])
+
+
+def __getattr__(name: str):
+    # PEP 562: module attributes such as image_analysis_llm resolve to the lazily built LLM
+    if name in _LLM_ROLES:
+        return get_llm(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,13 @@
 """CLI interface for the PDF Hunter orchestrator."""
 
-import json
 import os
 import asyncio
 import argparse
 from loguru import logger
 
 from .graph import orchestrator_graph
-from ..shared.utils.serializer import serialize_state_safely
+from ..shared.utils.serializer import dump_state_to_file
+from ..shared.utils.mcp_client import cleanup_mcp_session
 from ..config.logging_config import setup_logging
 
 
@@ -128,7 +128,6 @@ async def main():
             
     finally:
         # Cleanup MCP session when done
-        from ..shared.utils.mcp_client import cleanup_mcp_session
         logger.debug("Cleaning up MCP session", agent="Orchestrator")
         await cleanup_mcp_session()
 
@@ -158,12 +157,8 @@ async def main():
             # Full path for the JSON file
             json_path = os.path.join(session_output_directory, filename)
 
-            # Convert final state to JSON-serializable format
-            serializable_state = serialize_state_safely(final_state)
-
-            # Save to JSON file
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(serializable_state, f, indent=2, ensure_ascii=False)
+            # Convert, encode and save the final state to JSON
+            await dump_state_to_file(final_state, json_path)
 
             logger.info(f"Final state saved to: {json_path}",
                        agent="Orchestrator",
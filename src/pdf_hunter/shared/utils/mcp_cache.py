@@ -0,0 +1,80 @@
+import asyncio
+import hashlib
+import os
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+import orjson
+import ormsgpack
+
+_MISS = object()
+
+
+def tool_cache_key(tool_name: str, args: Any) -> str:
+    """
+    Content-address a tool invocation.
+
+    Args:
+        tool_name: Name of the tool being invoked
+        args: Tool arguments (serialized with sorted keys so argument order does not matter)
+
+    Returns:
+        Hex BLAKE2b digest of the tool name and canonical arguments
+    """
+    canonical_args = orjson.dumps(args, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.blake2b(tool_name.encode("utf-8") + b"\0" + canonical_args, digest_size=16).hexdigest()
+
+
+async def cached_invoke(tool, args: Any, ttl: float, cache_dir: str, should_cache: Optional[Callable[[Any], bool]] = None):
+    """
+    Invoke a synchronous tool through a TTL-bounded on-disk cache.
+
+    Only use this for deterministic lookups (e.g. WHOIS) - stateful tools such as
+    browser actions must always execute. Entries live in `cache_dir` as
+    `<key>.msgpack`; an entry older than `ttl` seconds is treated as a miss.
+    Delete the directory to invalidate.
+
+    Args:
+        tool: LangChain tool exposing `name` and `invoke(args)`
+        args: Arguments for the tool
+        ttl: Maximum age of a cached response in seconds
+        cache_dir: Directory holding cache entries (created on first write)
+        should_cache: Optional predicate; responses it rejects (e.g. transient errors) are not stored
+
+    Returns:
+        The tool response, from cache or from a fresh invocation
+    """
+    path = os.path.join(cache_dir, f"{tool_cache_key(tool.name, args)}.msgpack")
+
+    def _read():
+        try:
+            if time.time() - os.path.getmtime(path) >= ttl:
+                return _MISS
+            with open(path, "rb") as f:
+                return ormsgpack.unpackb(f.read())
+        except (OSError, ormsgpack.MsgpackDecodeError):
+            return _MISS
+
+    cached = await asyncio.to_thread(_read)
+    if cached is not _MISS:
+        return cached
+
+    result = await asyncio.to_thread(tool.invoke, args)
+
+    if should_cache is None or should_cache(result):
+        def _write():
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a unique temp file and swap in atomically so concurrent readers never see partial entries
+            tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(ormsgpack.packb(result))
+            os.replace(tmp_path, path)
+
+        try:
+            await asyncio.to_thread(_write)
+        except (OSError, ormsgpack.MsgpackEncodeError):
+            # Caching is best-effort; the fresh result is still returned
+            pass
+
+    return result
@@ -122,12 +122,16 @@ async def get_mcp_session(task_id: str = None, base_output_dir: str = None):
 
         return await _session_managers[session_key].get_session()
 
-async def cleanup_mcp_session(task_id: str = None):
+async def cleanup_mcp_session(task_id: str = None, base_output_dir: str = None):
     """Cleanup MCP session(s). Call this when shutting down.
+
+    Safe to call repeatedly: sessions already released (for example by
+    mcp_session_scope) are simply no longer registered.
     
     Args:
         task_id: If provided, cleanup only the specific task session. 
                  If None, cleanup all sessions.
+        base_output_dir: Base output directory the task session was created with.
     """
     global _session_managers, _session_lock
     
@@ -136,13 +140,29 @@ async def cleanup_mcp_session(task_id: str = None):
         
     async with _session_lock:
         if task_id:
-            # Cleanup specific task session
-            session_key = task_id
+            # Cleanup specific task session (same key get_mcp_session used)
+            session_key = f"{task_id}_{base_output_dir or 'default'}"
             if session_key in _session_managers:
                 await _session_managers[session_key].cleanup()
                 del _session_managers[session_key]
+            _clients.pop(session_key, None)
         else:
             # Cleanup all sessions
             for session_manager in _session_managers.values():
                 await session_manager.cleanup()
             _session_managers.clear()
+            _clients.clear()
+
+
+@asynccontextmanager
+async def mcp_session_scope(task_id: str, base_output_dir: str = None):
+    """Bound the lifetime of a task-specific MCP session.
+
+    The session is still created lazily by the first get_mcp_session() call
+    inside the block; on exit the browser is shut down and the client released,
+    so long-running processes do not accumulate one browser per investigated URL.
+    """
+    try:
+        yield
+    finally:
+        await cleanup_mcp_session(task_id, base_output_dir)
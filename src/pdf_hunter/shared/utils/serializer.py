@@ -1,11 +1,12 @@
 import json
 import asyncio
+import orjson
 from typing import Any, Dict
 
 def serialize_state_safely(state: Dict[str, Any]) -> str:
     """
     Safely serialize orchestrator state to JSON string, handling:
-    - Pydantic models via model_dump()
+    - Pydantic models via model_dump(mode="json") (pydantic-core emits JSON-ready values)
     - Missing/None fields
     - Complex nested structures
     - Non-serializable objects
@@ -13,7 +14,7 @@ def serialize_state_safely(state: Dict[str, Any]) -> str:
     def make_serializable(obj):
         # Handle Pydantic models
         if hasattr(obj, 'model_dump'):
-            return obj.model_dump()
+            return obj.model_dump(mode="json", fallback=str)
         # Handle dictionaries recursively
         elif isinstance(obj, dict):
             return {
@@ -24,10 +25,13 @@ def serialize_state_safely(state: Dict[str, Any]) -> str:
         # Handle lists recursively
         elif isinstance(obj, list):
             return [make_serializable(item) for item in obj]
-        # Handle primitives and fallback
+        # JSON primitives need no encoding probe
+        elif obj is None or isinstance(obj, (str, int, float, bool)):
+            return obj
+        # Handle other values and fallback
         else:
             try:
-                json.dumps(obj)  # Test if serializable
+                json.dumps(obj)  # Test if serializable (callers may encode the result with stdlib json)
                 return obj
             except (TypeError, ValueError):
                 return str(obj)  # Convert to string as fallback
@@ -40,13 +44,16 @@ def serialize_state_safely(state: Dict[str, Any]) -> str:
 async def dump_state_to_file(state: Dict[str, Any], file_path: str):
     """
     Dump the orchestrator state to a JSON file safely.
+
+    Converting the state tree and encoding it run in a worker thread together
+    with the write, so large states do not block the event loop.
     """
-    serializable_state = serialize_state_safely(state)
-    
-    # Define a function to handle file I/O
+    # Define a function to handle conversion, encoding and file I/O (orjson emits UTF-8 bytes directly)
     def write_file(path, data):
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        serializable_state = serialize_state_safely(data)
+        payload = orjson.dumps(serializable_state, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        with open(path, 'wb') as f:
+            f.write(payload)
             
     # Use asyncio.to_thread to avoid blocking
-    await asyncio.to_thread(write_file, file_path, serializable_state)
+    await asyncio.to_thread(write_file, file_path, state)
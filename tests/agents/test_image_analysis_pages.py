@@ -0,0 +1,203 @@
+"""Test page dispatch in the Image Analysis agent."""
+
+import asyncio
+import base64
+import io
+
+from PIL import Image
+
+from pdf_hunter.agents.image_analysis import nodes
+from pdf_hunter.agents.image_analysis.schemas import PageAnalysisResult
+from pdf_hunter.agents.pdf_extraction.schemas import ExtractedImage, ExtractedURL
+
+
+class FakeVisionLLM:
+    """Stand-in for the structured-output vision LLM that records each page prompt."""
+
+    def __init__(self):
+        self.prompts = []
+        self.running = 0
+        self.peak = 0
+
+    async def ainvoke(self, messages):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        self.prompts.append(messages[1].content[0]["text"])
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return PageAnalysisResult(
+            page_description=f"page {len(self.prompts)}",
+            visual_verdict="Benign",
+            confidence_score=0.9,
+            summary="Nothing deceptive.",
+        )
+
+
+def _state(page_count):
+    return {
+        "extracted_images": [
+            ExtractedImage(page_number=i, base64_data="aGVsbG8=", image_format="png") for i in range(page_count)
+        ],
+        "extracted_urls": [ExtractedURL(url="https://example.com", page_number=1, url_type="annotation")],
+        "number_of_pages_to_process": page_count,
+        "session_id": "test_session",
+    }
+
+
+def test_pages_chain_context_by_default(monkeypatch):
+    """Sequential mode passes each page's briefing to the next page."""
+    llm = FakeVisionLLM()
+    monkeypatch.setattr(nodes, "_get_vision_llm", lambda: llm)
+    monkeypatch.setattr(nodes, "IMAGE_ANALYSIS_PARALLEL_PAGES", False)
+    monkeypatch.setattr(nodes, "IMAGE_ANALYSIS_PAGE_CACHE_DIR", None)
+
+    result = asyncio.run(nodes.analyze_pdf_images(_state(2)))
+
+    assert len(result["page_analyses"]) == 2
+    assert llm.peak == 1
+    assert "This is the first page" in llm.prompts[0]
+    assert "Page Appearance: page 1" in llm.prompts[1]
+    assert "(Page 0)" in llm.prompts[1]
+    assert [page.page_number for page in result["page_analyses"]] == [0, 1]
+    assert "https://example.com" in llm.prompts[1]
+
+
+def test_pages_analyzed_concurrently_when_enabled(monkeypatch):
+    """Parallel mode sends all pages at once and keeps results in page order."""
+    llm = FakeVisionLLM()
+    monkeypatch.setattr(nodes, "_get_vision_llm", lambda: llm)
+    monkeypatch.setattr(nodes, "IMAGE_ANALYSIS_PARALLEL_PAGES", True)
+    monkeypatch.setattr(nodes, "IMAGE_ANALYSIS_PAGE_CACHE_DIR", None)
+
+    result = asyncio.run(nodes.analyze_pdf_images(_state(3)))
+
+    assert len(result["page_analyses"]) == 3
+    assert llm.peak == 3
+    assert all(nodes._INDEPENDENT_PAGE_CONTEXT in prompt for prompt in llm.prompts)
+    assert [page.page_number for page in result["page_analyses"]] == [0, 1, 2]
+
+
+def test_failed_page_cancels_remaining_pages(monkeypatch):
+    """In independent mode one failing page cancels the other in-flight vision calls and fails the node."""
+    started = []
+    cancelled = []
+
+    class FailingVisionLLM:
+        async def ainvoke(self, messages):
+            prompt = messages[1].content[0]["text"]
+            if '"page_number":0,' in prompt:
+                # Fail only once the other pages' calls are in flight
+                while len(started) < 2:
+                    await asyncio.sleep(0.001)
+                raise RuntimeError("vision call failed")
+            started.append(prompt)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(prompt)
+                raise
+
+    monkeypatch.setattr(nodes, "_get_vision_llm", lambda: FailingVisionLLM())
+    monkeypatch.setattr(nodes, "IMAGE_ANALYSIS_PARALLEL_PAGES", True)
+    monkeypatch.setattr(nodes, "IMAGE_ANALYSIS_PAGE_CACHE_DIR", None)
+
+    result = asyncio.run(nodes.analyze_pdf_images(_state(3)))
+
+    assert result["errors"] == ["Error in analyze_pdf_images: RuntimeError: vision call failed"]
+    assert len(cancelled) == 2
+
+
+def test_repeated_pages_served_from_cache(monkeypatch, tmp_path):
+    """An identical page and prompt reuses the stored verdict; a changed prompt calls the LLM again."""
+    llm = FakeVisionLLM()
+    monkeypatch.setattr(nodes, "_get_vision_llm", lambda: llm)
+    monkeypatch.setattr(nodes, "IMAGE_ANALYSIS_PARALLEL_PAGES", True)
+    monkeypatch.setattr(nodes, "IMAGE_ANALYSIS_PAGE_CACHE_DIR", ".visual_cache")
+
+    def session_state():
+        state = _state(1)
+        state["output_directory"] = str(tmp_path / "test_session")
+        return state
+
+    first = asyncio.run(nodes.analyze_pdf_images(session_state()))
+    second = asyncio.run(nodes.analyze_pdf_images(session_state()))
+    changed = session_state()
+    changed["extracted_urls"] = [ExtractedURL(url="https://other.example", page_number=0, url_type="annotation")]
+    asyncio.run(nodes.analyze_pdf_images(changed))
+
+    assert second["page_analyses"] == first["page_analyses"]
+    assert len(llm.prompts) == 2
+    # The cache lives under the output root, next to the session directory
+    assert len(list((tmp_path / ".visual_cache").glob("*.json"))) == 2
+
+
+def test_page_cache_key_includes_model():
+    """A verdict cached for one model is not served for another."""
+    messages = nodes._build_page_messages(_state(1)["extracted_images"][0], [], "context")
+
+    assert nodes._page_cache_key(messages, "gpt-4.1") != nodes._page_cache_key(messages, "gpt-4.1-mini")
+
+
+def test_failed_cache_write_leaves_no_temp_file(monkeypatch, tmp_path):
+    """A cache write that fails is dropped without leaving its temp file behind."""
+    llm = FakeVisionLLM()
+    monkeypatch.setattr(nodes, "_get_vision_llm", lambda: llm)
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(nodes.os, "replace", failing_replace)
+    messages = nodes._build_page_messages(_state(1)["extracted_images"][0], [], "context")
+
+    result = asyncio.run(nodes._invoke_page_llm(messages, str(tmp_path)))
+
+    assert result.summary == "Nothing deceptive."
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_compiled_verdict_is_most_severe_page(tmp_path):
+    """The overall verdict is the most severe page verdict, with the top confidence among those pages."""
+
+    def page(page_number, verdict, confidence, tactic_count):
+        return PageAnalysisResult(
+            page_number=page_number,
+            page_description=verdict,
+            visual_verdict=verdict,
+            confidence_score=confidence,
+            summary="",
+            deception_tactics=[
+                {"tactic_type": "urgency", "description": "", "confidence": confidence} for _ in range(tactic_count)
+            ],
+        )
+
+    pages = [page(2, "Suspicious", 0.6, 1), page(0, "Benign", 0.99, 0), page(1, "Suspicious", 0.8, 2)]
+    state = {"page_analyses": pages, "session_id": "test_session", "output_directory": str(tmp_path)}
+
+    report = asyncio.run(nodes.compile_image_findings(state))["visual_analysis_report"]
+
+    assert report.overall_verdict == "Suspicious"
+    assert report.overall_confidence == 0.8
+    assert len(report.all_deception_tactics) == 3
+    assert report.document_flow_summary == "Page 0: Benign\nPage 1: Suspicious\nPage 2: Suspicious"
+
+
+def test_large_page_images_are_downscaled(monkeypatch):
+    """Pages larger than IMAGE_ANALYSIS_MAX_IMAGE_EDGE are resized; smaller ones are sent unchanged."""
+    monkeypatch.setattr(nodes, "IMAGE_ANALYSIS_MAX_IMAGE_EDGE", 100)
+
+    def page_image(size):
+        buffer = io.BytesIO()
+        Image.new("RGB", size, "white").save(buffer, format="PNG")
+        return ExtractedImage(page_number=0, base64_data=base64.b64encode(buffer.getvalue()).decode(), image_format="png")
+
+    large, small = page_image((400, 200)), page_image((80, 40))
+    sent = nodes._page_image_url(large).removeprefix("data:image/png;base64,")
+
+    assert Image.open(io.BytesIO(base64.b64decode(sent))).size == (100, 50)
+    assert nodes._page_image_url(small) == f"data:image/png;base64,{small.base64_data}"
+
+
+def test_page_number_hidden_from_llm_schema():
+    """The agent sets page_number itself, so it is not part of the LLM's output schema."""
+    assert "page_number" not in PageAnalysisResult.model_json_schema()["properties"]
+    assert PageAnalysisResult.model_validate_json('{"page_description": "", "visual_verdict": "Benign", "confidence_score": 1.0, "summary": "", "page_number": 3}').page_number == 3
@@ -0,0 +1,164 @@
+"""Test the analyst node of the URL investigation agent."""
+
+import asyncio
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from pdf_hunter.agents.image_analysis.schemas import PrioritizedURL, URLMissionStatus
+from pdf_hunter.agents.url_investigation import nodes
+from pdf_hunter.agents.url_investigation.schemas import AnalystFindings
+
+
+class FakeAnalyst:
+    """Stand-in for the structured-output analyst LLM that records its prompt."""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def astream(self, messages):
+        self.prompts.append(messages)
+        # Partial value first, complete value last - the node keeps the last one
+        yield AnalystFindings(final_url="https://example.com/", verdict="Benign", confidence=0.0, summary="", mission_status="completed")
+        yield AnalystFindings(
+            final_url="https://example.com/",
+            verdict="Benign",
+            confidence=0.8,
+            summary="Landing page only.",
+            mission_status="completed",
+        )
+
+
+def test_analyst_receives_log_and_reuses_dump(monkeypatch):
+    """A short log is passed to the analyst verbatim and stored on the report."""
+    analyst = FakeAnalyst()
+    monkeypatch.setattr(nodes, "_get_analyst_llm", lambda: analyst)
+
+    url_task = PrioritizedURL(url="https://example.com", priority=1, reason="QR code on page 1", page_number=0)
+    investigation_log = [
+        SystemMessage(content="system"),
+        HumanMessage(content="Begin your investigation."),
+        AIMessage(content="", tool_calls=[{"name": "browser_navigate", "args": {"url": "https://example.com"}, "id": "1"}]),
+        ToolMessage(content="Page title: Example Domain", name="browser_navigate", tool_call_id="1"),
+        AIMessage(content="Nothing suspicious."),
+    ]
+
+    result = asyncio.run(nodes.analyze_url_content({"url_task": url_task, "investigation_logs": investigation_log}))
+
+    report = result["link_analysis_final_report"]
+    prompt = analyst.prompts[0][1].content
+    assert "Page title: Example Domain" in prompt
+    assert "QR code on page 1" in prompt
+    assert len(report.full_investigation_log) == len(investigation_log)
+    assert report.full_investigation_log[3]["content"] == "Page title: Example Domain"
+    assert report.analyst_findings.summary == "Landing page only."
+    assert url_task.mission_status == URLMissionStatus.COMPLETED
+
+
+def test_log_table_is_one_row_per_message():
+    """The columnar log keeps each message on one row with delimiters escaped."""
+    investigation_log = [
+        AIMessage(content="", tool_calls=[{"name": "domain_whois", "args": {"domain": "example.com"}, "id": "1"}]),
+        ToolMessage(content="Registrar: A | B\nCreated: 2001", name="domain_whois", tool_call_id="1"),
+    ]
+
+    table = nodes._format_log_table(investigation_log)
+    header, ai_row, tool_row = table.split("\n")
+
+    assert header == "idx|role|name|tool_call_id|tool_calls|content"
+    assert ai_row.startswith("0|ai|||")
+    assert '"domain_whois"' in ai_row
+    assert tool_row == "1|tool|domain_whois|1||Registrar: A \\| B\\nCreated: 2001"
+
+
+def test_analyst_skipped_without_successful_tool_output(monkeypatch):
+    """If every tool call failed, the report is built locally without calling the analyst LLM."""
+    analyst = FakeAnalyst()
+    monkeypatch.setattr(nodes, "_get_analyst_llm", lambda: analyst)
+
+    url_task = PrioritizedURL(url="https://unreachable.example", priority=1, reason="test", page_number=0)
+    investigation_log = [
+        AIMessage(content="", tool_calls=[{"name": "browser_navigate", "args": {"url": "https://unreachable.example"}, "id": "1"}]),
+        ToolMessage(content="Tool execution failed: net::ERR_NAME_NOT_RESOLVED", name="browser_navigate", tool_call_id="1"),
+        AIMessage(content="The domain does not resolve."),
+    ]
+
+    result = asyncio.run(nodes.analyze_url_content({"url_task": url_task, "investigation_logs": investigation_log}))
+
+    findings = result["link_analysis_final_report"].analyst_findings
+    assert analyst.prompts == []
+    assert findings.verdict == "Inaccessible"
+    assert findings.mission_status == "failed"
+    assert "does not resolve" in findings.summary
+    assert url_task.mission_status == URLMissionStatus.FAILED
+
+
+def test_log_table_truncates_large_tool_output():
+    """Oversized tool outputs keep only their start and end in the analyst table."""
+    investigation_log = [ToolMessage(content="head" + "a" * 42 + "tail", name="browser_snapshot", tool_call_id="1")]
+
+    table = nodes._format_log_table(investigation_log, max_tool_chars=10)
+
+    assert table.split("\n")[1].endswith("|heada\\n... [40 chars omitted] ...\\natail")
+
+
+def test_summarizer_falls_back_to_log_table(monkeypatch):
+    """If the summarization LLM fails, the analyst gets the columnar log instead."""
+    class FailingLLM:
+        async def ainvoke(self, messages):
+            raise RuntimeError("rate limited")
+
+    monkeypatch.setattr(nodes, "get_llm", lambda name: FailingLLM())
+
+    url_task = PrioritizedURL(url="https://example.com", priority=1, reason="test", page_number=0)
+    investigation_log = [ToolMessage(content="Page title: Example Domain", name="browser_navigate", tool_call_id="1")]
+
+    text = asyncio.run(nodes.summarize_investigation_log(investigation_log, url_task.reason))
+
+    assert text.startswith("idx|role|name|tool_call_id|tool_calls|content")
+    assert "Page title: Example Domain" in text
+
+
+def test_summarizer_prompt_carries_flag_reason(monkeypatch):
+    """The mission reason from the PrioritizedURL reaches the summarization prompt."""
+    prompts = []
+
+    class CapturingLLM:
+        async def ainvoke(self, messages):
+            prompts.append(messages[0].content)
+            return AIMessage(content="Visited the page; nothing suspicious.")
+
+    monkeypatch.setattr(nodes, "get_llm", lambda name: CapturingLLM())
+
+    investigation_log = [ToolMessage(content="Page title: Example Domain", name="browser_navigate", tool_call_id="1")]
+    text = asyncio.run(nodes.summarize_investigation_log(investigation_log, "Fake CAPTCHA button on page 2"))
+
+    assert text == "Visited the page; nothing suspicious."
+    assert "Fake CAPTCHA button on page 2" in prompts[0]
+
+
+def test_compact_log_text_previews_messages():
+    """The summarizer input keeps turns and tool names but only a preview of each output."""
+    investigation_log = [
+        AIMessage(content="Checking the landing page.", tool_calls=[{"name": "browser_snapshot", "args": {}, "id": "1"}]),
+        ToolMessage(content="b" * 50, name="browser_snapshot", tool_call_id="1"),
+    ]
+
+    text = nodes._compact_log_text(investigation_log, preview_chars=10)
+
+    assert "=== Investigator Turn 1 ===" in text
+    assert "Tools called: browser_snapshot" in text
+    assert "Response preview: " + "b" * 10 + "..." in text
+    assert "b" * 11 not in text
+
+
+def test_summarizer_handles_log_without_previewable_messages(monkeypatch):
+    """A log with nothing to preview is summarized without a division by zero."""
+    class EchoLLM:
+        async def ainvoke(self, messages):
+            return AIMessage(content="Nothing was investigated.")
+
+    monkeypatch.setattr(nodes, "get_llm", lambda name: EchoLLM())
+
+    text = asyncio.run(nodes.summarize_investigation_log([HumanMessage(content="Begin.")], "test"))
+
+    assert text == "Nothing was investigated."
@@ -0,0 +1,125 @@
+"""Test in-flight deduplication of URL investigations."""
+
+import asyncio
+
+from pdf_hunter.agents.image_analysis.schemas import PrioritizedURL, URLMissionStatus
+from pdf_hunter.agents.url_investigation import graph
+from pdf_hunter.agents.url_investigation.schemas import URLAnalysisResult, AnalystFindings
+
+
+def test_canonical_url():
+    """Case, trailing slashes and fragments do not create distinct URLs."""
+    assert graph._canon("HTTPS://Example.COM/login/#top") == graph._canon("https://example.com/login")
+    assert graph._canon("https://example.com") == "https://example.com/"
+    assert graph._canon("https://example.com/?a=1") != graph._canon("https://example.com/?a=2")
+
+
+def test_duplicate_urls_share_one_investigation(monkeypatch):
+    """Two concurrent requests for the same URL run the investigator once."""
+    calls = []
+
+    class FakeInvestigator:
+        async def ainvoke(self, state):
+            calls.append(state["url_task"].url)
+            await asyncio.sleep(0.01)
+            url_task = state["url_task"]
+            url_task.mission_status = URLMissionStatus.COMPLETED
+            return {
+                "link_analysis_final_report": URLAnalysisResult(
+                    initial_url=url_task,
+                    full_investigation_log=[],
+                    analyst_findings=AnalystFindings(
+                        final_url=url_task.url,
+                        verdict="Benign",
+                        confidence=0.9,
+                        summary="ok",
+                        mission_status="completed",
+                    ),
+                ),
+                "errors": [],
+            }
+
+    monkeypatch.setattr(graph, "link_investigator_graph", FakeInvestigator())
+    monkeypatch.setattr(graph, "_inflight_lock", None)
+
+    first = PrioritizedURL(url="https://example.com/a", priority=1, reason="test", page_number=0)
+    second = PrioritizedURL(url="https://EXAMPLE.com/a/", priority=1, reason="test", page_number=1)
+
+    async def run():
+        return await asyncio.gather(
+            graph.conduct_link_analysis({"url_task": first, "output_directory": "out"}),
+            graph.conduct_link_analysis({"url_task": second, "output_directory": "out"}),
+        )
+
+    results = asyncio.run(run())
+
+    assert calls == ["https://example.com/a"]
+    assert sum(len(r.get("link_analysis_final_reports", [])) for r in results) == 1
+    assert second.mission_status == URLMissionStatus.COMPLETED
+
+
+def test_inflight_state_is_bound_per_event_loop():
+    """Each event loop gets its own in-flight lock and task map."""
+
+    async def inflight():
+        return graph._get_inflight()
+
+    first_lock, first_map = asyncio.run(inflight())
+    first_map[("out", "https://example.com/")] = None
+    second_lock, second_map = asyncio.run(inflight())
+
+    assert second_lock is not first_lock
+    assert second_map == {}
+
+
+def test_hung_investigation_times_out(monkeypatch):
+    """A stalled investigation is reported as a failed mission instead of blocking."""
+
+    class HungInvestigator:
+        async def ainvoke(self, state):
+            await asyncio.sleep(10)
+
+    monkeypatch.setattr(graph, "link_investigator_graph", HungInvestigator())
+    monkeypatch.setattr(graph, "_inflight_lock", None)
+    monkeypatch.setattr(graph, "URL_INVESTIGATION_TIMEOUT", 0.05)
+
+    url_task = PrioritizedURL(url="https://slow.example.com", priority=1, reason="test", page_number=0)
+    result = asyncio.run(graph.conduct_link_analysis({"url_task": url_task, "output_directory": "out"}))
+
+    report = result["link_analysis_final_reports"][0]
+    assert isinstance(report, URLAnalysisResult)
+    assert report.analyst_findings.mission_status == "failed"
+    assert url_task.mission_status == URLMissionStatus.FAILED
+    assert "timed out" in result["errors"][0]
+    assert graph._inflight == {}
+
+
+def test_mission_concurrency_is_capped(monkeypatch):
+    """No more than URL_INVESTIGATION_MAX_CONCURRENCY investigations run at once."""
+    running = 0
+    peak = 0
+
+    class CountingInvestigator:
+        async def ainvoke(self, state):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"link_analysis_final_report": None, "errors": []}
+
+    monkeypatch.setattr(graph, "link_investigator_graph", CountingInvestigator())
+    monkeypatch.setattr(graph, "_inflight_lock", None)
+    monkeypatch.setattr(graph, "URL_INVESTIGATION_MAX_CONCURRENCY", 2)
+    monkeypatch.setattr(graph, "_mission_semaphore", None)
+
+    url_tasks = [PrioritizedURL(url=f"https://example.com/{i}", priority=1, reason="test", page_number=0) for i in range(5)]
+
+    async def run():
+        return await asyncio.gather(*(
+            graph.conduct_link_analysis({"url_task": url_task, "output_directory": "out"}) for url_task in url_tasks
+        ))
+
+    asyncio.run(run())
+
+    assert peak == 2
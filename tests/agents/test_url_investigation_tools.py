@@ -0,0 +1,220 @@
+"""Test tool-call execution in the URL investigation agent."""
+
+import asyncio
+
+from langchain_core.messages import AIMessage, ToolMessage
+
+from pdf_hunter.agents.image_analysis.schemas import PrioritizedURL
+from pdf_hunter.agents.url_investigation import nodes
+from pdf_hunter.shared.utils.mcp_cache import cached_invoke
+
+
+class FakeTool:
+    """Minimal stand-in for a LangChain tool that records call order."""
+
+    def __init__(self, name, events, delay=0.05):
+        self.name = name
+        self.events = events
+        self.delay = delay
+
+    async def ainvoke(self, args):
+        self.events.append(f"start:{self.name}")
+        await asyncio.sleep(self.delay)
+        self.events.append(f"end:{self.name}")
+        return f"{self.name} ok"
+
+    def invoke(self, args):
+        self.events.append(f"start:{self.name}")
+        self.events.append(f"end:{self.name}")
+        return f"{self.name} ok"
+
+
+def _patch_tools(monkeypatch, events, loads, sessions=None):
+    sessions = {} if sessions is None else sessions
+
+    async def fake_session(task_id=None, base_output_dir=None):
+        return sessions.setdefault((task_id, base_output_dir), object())
+
+    async def fake_load(session):
+        loads.append(session)
+        return [FakeTool("browser_navigate", events), FakeTool("browser_snapshot", events)]
+
+    class FakeLLM:
+        def bind_tools(self, tools):
+            return self
+
+    monkeypatch.setattr(nodes, "get_mcp_session", fake_session)
+    monkeypatch.setattr(nodes, "load_mcp_tools_async", fake_load)
+    monkeypatch.setattr(nodes, "domain_whois", FakeTool("domain_whois", events))
+    monkeypatch.setattr(nodes, "get_llm", lambda name: FakeLLM())
+    monkeypatch.setattr(nodes, "_toolbelt_cache", {})
+
+
+def test_tool_calls_keep_order_and_overlap(monkeypatch, tmp_path):
+    """Browser calls run in order while local tools run alongside them; results keep call order."""
+    events = []
+    _patch_tools(monkeypatch, events, [])
+
+    tool_calls = [
+        {"name": "browser_navigate", "args": {"url": "https://example.com"}, "id": "1"},
+        {"name": "domain_whois", "args": {"domain": "example.com"}, "id": "2"},
+        {"name": "browser_snapshot", "args": {}, "id": "3"},
+    ]
+    state = {
+        "investigation_logs": [AIMessage(content="", tool_calls=tool_calls)],
+        "url_task": PrioritizedURL(url="https://example.com", priority=1, reason="test", page_number=0),
+        "output_directory": str(tmp_path),
+    }
+
+    result = asyncio.run(nodes.execute_browser_tools(state))
+    messages = result["investigation_logs"]
+
+    assert [m.tool_call_id for m in messages] == ["1", "2", "3"]
+    assert [m.content for m in messages] == ["browser_navigate ok", "domain_whois ok", "browser_snapshot ok"]
+    # Browser tools never interleave
+    assert events.index("end:browser_navigate") < events.index("start:browser_snapshot")
+    # WHOIS did not wait for the browser chain
+    assert events.index("end:domain_whois") < events.index("end:browser_navigate")
+
+
+def test_task_context_loaded_once_per_investigation(monkeypatch):
+    """Repeated turns reuse the session and tools until the toolbelt is evicted."""
+    loads = []
+    _patch_tools(monkeypatch, [], loads)
+
+    async def run():
+        first = await nodes._get_task_toolbelt("url_1", "out")
+        second = await nodes._get_task_toolbelt("url_1", "out")
+        nodes.evict_task_toolbelt("url_1", "out")
+        third = await nodes._get_task_toolbelt("url_1", "out")
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+
+    assert first is second
+    assert third is not first
+    assert len(loads) == 2
+    assert set(first.tool_by_name) >= {"browser_navigate", "browser_snapshot", "domain_whois"}
+
+
+def test_task_id_is_stable():
+    """Task IDs are deterministic digests, not per-process hash() values."""
+    task_id = nodes.get_url_task_id("https://example.com/login")
+    assert task_id == nodes.get_url_task_id("https://example.com/login")
+    assert task_id != nodes.get_url_task_id("https://example.com/logout")
+    assert task_id.startswith("url_") and len(task_id) == len("url_") + 16
+
+
+def test_cached_invoke_reuses_fresh_entries(tmp_path):
+    """Deterministic lookups hit the disk cache until the TTL expires; rejected results are not stored."""
+    events = []
+    whois = FakeTool("domain_whois", events)
+    cache_dir = str(tmp_path / ".mcp_cache")
+
+    async def run():
+        first = await cached_invoke(whois, {"domain": "example.com"}, ttl=60, cache_dir=cache_dir)
+        second = await cached_invoke(whois, {"domain": "example.com"}, ttl=60, cache_dir=cache_dir)
+        expired = await cached_invoke(whois, {"domain": "example.com"}, ttl=0, cache_dir=cache_dir)
+        await cached_invoke(whois, {"domain": "other.com"}, ttl=60, cache_dir=cache_dir, should_cache=lambda r: False)
+        await cached_invoke(whois, {"domain": "other.com"}, ttl=60, cache_dir=cache_dir)
+        return first, second, expired
+
+    first, second, expired = asyncio.run(run())
+
+    assert first == second == expired == "domain_whois ok"
+    # example.com: initial call + expired refresh; other.com: both calls (first result was not cached)
+    assert events.count("start:domain_whois") == 4
+
+
+def test_investigator_cache_reuses_identical_history(monkeypatch):
+    """The same message history is answered from cache; a different one calls the LLM."""
+    monkeypatch.setattr(nodes, "_INVESTIGATOR_CACHE", nodes.OrderedDict())
+    calls = []
+
+    class FakeModel:
+        async def ainvoke(self, messages):
+            calls.append(len(messages))
+            return AIMessage(content=f"step {len(calls)}")
+
+    history = [AIMessage(content="navigate"), AIMessage(content="snapshot")]
+
+    async def run():
+        first = await nodes._invoke_investigator(FakeModel(), history)
+        again = await nodes._invoke_investigator(FakeModel(), list(history))
+        other = await nodes._invoke_investigator(FakeModel(), history[:1])
+        return first, again, other
+
+    first, again, other = asyncio.run(run())
+
+    assert first is again
+    assert other.content == "step 2"
+    assert calls == [2, 1]
+
+
+def test_old_large_tool_outputs_are_spilled(tmp_path):
+    """Oversized tool outputs from earlier turns become a preview + file; the latest batch stays whole."""
+    big = "x" * (nodes.URL_INVESTIGATION_SPILL_THRESHOLD + 1)
+    messages = [
+        AIMessage(content="", tool_calls=[{"name": "browser_snapshot", "args": {}, "id": "1"}]),
+        ToolMessage(content=big, name="browser_snapshot", tool_call_id="1"),
+        AIMessage(content="", tool_calls=[{"name": "browser_snapshot", "args": {}, "id": "2"}]),
+        ToolMessage(content=big, name="browser_snapshot", tool_call_id="2"),
+    ]
+
+    compacted = nodes._compact_history(messages, str(tmp_path))
+
+    assert compacted[1].content.startswith("[Earlier tool output of")
+    assert len(compacted[1].content) < len(big)
+    assert compacted[3].content == big
+    assert messages[1].content == big
+    spilled = list(tmp_path.iterdir())
+    assert len(spilled) == 1 and spilled[0].read_text() == big
+
+
+def test_task_context_reloaded_after_reconnect(monkeypatch):
+    """A new live session for the task invalidates the cached toolbelt."""
+    loads = []
+    sessions = {}
+    _patch_tools(monkeypatch, [], loads, sessions)
+
+    async def run():
+        first = await nodes._get_task_toolbelt("url_1", "out")
+        sessions[("url_1", "out")] = object()  # session re-established
+        second = await nodes._get_task_toolbelt("url_1", "out")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert second is not first
+    assert second.session is sessions[("url_1", "out")]
+    assert len(loads) == 2
+
+
+def test_toolbelt_reloaded_after_ttl(monkeypatch):
+    """Toolbelts older than the TTL are rebuilt, and stale entries of other tasks are dropped."""
+    loads = []
+    _patch_tools(monkeypatch, [], loads)
+    monkeypatch.setattr(nodes, "URL_INVESTIGATION_TOOLBELT_TTL", 0)
+
+    async def run():
+        first = await nodes._get_task_toolbelt("url_1", "out")
+        await nodes._get_task_toolbelt("url_2", "out")
+        second = await nodes._get_task_toolbelt("url_1", "out")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert second is not first
+    assert len(loads) == 3
+    assert list(nodes._toolbelt_cache) == [("url_1", "out")]
+
+
+def test_investigator_cache_key_ignores_briefing_timestamp():
+    """Briefings that differ only in their timestamp map to the same cache entry."""
+    from langchain_core.messages import HumanMessage
+
+    def briefing(timestamp):
+        return [HumanMessage(content=f"\n    Current date and time: {timestamp}\n    Begin your investigation.\n")]
+
+    assert nodes._history_key(briefing("2025-01-01 10:00:00")) == nodes._history_key(briefing("2025-06-30 23:59:59"))
+    assert nodes._history_key(briefing("2025-01-01 10:00:00")) != nodes._history_key([HumanMessage(content="Begin your investigation.")])
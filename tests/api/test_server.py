@@ -52,6 +52,7 @@ def test_invalid_session_id():
         "123456",
         "../../../etc/passwd",
         "abc_20251001_120000",  # SHA1 too short
+        "a" * 40 + "_20251001_120000%0A",  # Trailing newline
     ]
     
     for invalid_id in invalid_ids:
@@ -76,6 +77,77 @@ def test_sse_stream_basic():
     print("✅ Test 4 passed (endpoint defined)!")
 
 
+def test_replay_log_frames(tmp_path, monkeypatch):
+    """Historical replay emits one SSE frame per non-empty log line across chunk boundaries."""
+    from pdf_hunter.api import server
+
+    monkeypatch.setattr(server, "REPLAY_CHUNK_SIZE", 16)
+    lines = [json.dumps({"message": f"event {i}", "emoji": "🔍"}) for i in range(5)]
+    log_file = tmp_path / "session.jsonl"
+    log_file.write_text("\n".join(lines[:3]) + "\n\n" + "\n".join(lines[3:]), encoding="utf-8")
+
+    async def collect():
+        return "".join([frames async for frames in server._replay_log_frames(log_file)])
+
+    output = asyncio.run(collect())
+
+    assert output == "".join(f"data: {line}\n\n" for line in lines)
+
+
+def test_wait_returns_when_analysis_finishes(monkeypatch):
+    """/wait returns as soon as the session's done event fires, with the in-memory status."""
+    from pdf_hunter.api import server
+
+    session_id = "0" * 40 + "_20251001_120000"
+    monkeypatch.setattr(server, "active_analyses", {})
+
+    async def run():
+        done = asyncio.Event()
+        server.active_analyses[session_id] = {"status": "running", "done": done, "report_available": False}
+
+        async def finish():
+            await asyncio.sleep(0.01)
+            server.active_analyses[session_id].update(status="complete", report_available=True)
+            done.set()
+
+        asyncio.create_task(finish())
+        return await server.wait_for_session(session_id, timeout=5)
+
+    data = asyncio.run(run())
+
+    assert data["status"] == "complete"
+    assert data["report_available"] is True
+
+
+def test_stream_reports_dropped_events(monkeypatch):
+    """An idle stream sends a keepalive comment, plus a diagnostic event once events were dropped."""
+    from pdf_hunter.api import server
+
+    session_id = "0" * 40 + "_20251001_120001"
+    monkeypatch.setattr(server, "SSE_KEEPALIVE_INTERVAL", 0.01)
+    add_sse_client = server.add_sse_client
+
+    def add_slow_client(session_id, queue):
+        server.dropped_messages[queue] = 3
+        add_sse_client(session_id, queue)
+
+    monkeypatch.setattr(server, "add_sse_client", add_slow_client)
+
+    async def first_frames(count):
+        response = await server.stream_logs(session_id)
+        frames = []
+        async for frame in response.body_iterator:
+            frames.append(frame)
+            if len(frames) == count:
+                break
+        await response.body_iterator.aclose()
+        return frames
+
+    frames = asyncio.run(first_frames(2))
+
+    assert frames == [": keepalive\n\n", 'event: diagnostic\ndata: {"dropped": 3}\n\n']
+
+
 def main():
     """Run all tests."""
     print("🧪 Testing FastAPI Server\n")
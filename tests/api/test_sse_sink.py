@@ -6,7 +6,9 @@ from pdf_hunter.config.logging_config import (
     setup_logging,
     add_sse_client,
     remove_sse_client,
-    connected_clients
+    connected_clients,
+    dropped_messages,
+    sse_sink
 )
 
 
@@ -153,6 +155,32 @@ async def test_cleanup():
     print("✅ Test 4 passed!")
 
 
+def test_slow_client_drops_oldest(monkeypatch):
+    """A full client queue keeps the newest events and counts what it dropped."""
+    import pdf_hunter.config.logging_config as logging_config
+
+    monkeypatch.setattr(logging_config, "MAX_QUEUE_SIZE", 2)
+    session_id = "test_session_005"
+    queue = asyncio.Queue()
+    add_sse_client(session_id, queue)
+
+    def event(i):
+        return json.dumps({"record": {"message": f"event {i}", "extra": {"session_id": session_id}}})
+
+    async def run():
+        for i in range(4):
+            await sse_sink(event(i))
+
+    try:
+        asyncio.run(run())
+        assert [json.loads(queue.get_nowait())["record"]["message"] for _ in range(queue.qsize())] == ["event 2", "event 3"]
+        assert dropped_messages[queue] == 2
+    finally:
+        remove_sse_client(session_id, queue)
+
+    assert queue not in dropped_messages
+
+
 async def main():
     """Run all tests."""
     print("🧪 Testing SSE Sink Functionality\n")
@@ -0,0 +1,44 @@
+"""Test model tier resolution in the model configuration."""
+
+from pdf_hunter.config import models_config
+
+
+AZURE_CONFIG = {
+    "model": "my-gpt-4o-deployment",
+    "azure_endpoint": "https://example.openai.azure.com/",
+    "api_key": "test",
+    "api_version": "2024-12-01-preview",
+    "temperature": 0.0,
+    "model_provider": "azure_openai",
+}
+
+
+def _use_provider(monkeypatch, config):
+    monkeypatch.setattr(models_config, "LLM_CONFIG", config)
+    monkeypatch.setattr(models_config, "MODEL_TIERS", models_config.tier_models(config))
+    monkeypatch.setattr(models_config, "FORCE_TIER", None)
+
+
+def test_provider_without_fast_tier_keeps_its_model(monkeypatch):
+    """Without a fast-tier deployment, fast roles run on the provider's configured model."""
+    monkeypatch.setitem(models_config.FAST_TIER_MODELS, "azure_openai", None)
+    _use_provider(monkeypatch, AZURE_CONFIG)
+    calls = []
+    monkeypatch.setattr(models_config, "init_chat_model", lambda **kwargs: calls.append(kwargs))
+
+    models_config.make_llm("final_verdict")
+
+    assert models_config.model_for_role("final_verdict") == "my-gpt-4o-deployment"
+    assert models_config.model_for_role("image_analysis") == "my-gpt-4o-deployment"
+    assert calls[0]["model"] == "my-gpt-4o-deployment"
+    assert calls[0]["azure_endpoint"] == AZURE_CONFIG["azure_endpoint"]
+    assert calls[0]["model_provider"] == "azure_openai"
+
+
+def test_fast_tier_uses_provider_fast_model(monkeypatch):
+    """A configured fast-tier deployment serves the fast roles only."""
+    monkeypatch.setitem(models_config.FAST_TIER_MODELS, "azure_openai", "my-mini-deployment")
+    _use_provider(monkeypatch, AZURE_CONFIG)
+
+    assert models_config.model_for_role("file_analysis_triage") == "my-mini-deployment"
+    assert models_config.model_for_role("report_generator") == "my-gpt-4o-deployment"